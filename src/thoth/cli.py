@@ -3,9 +3,6 @@
 import sys
 import typer
 from dotenv import load_dotenv
-from .display import show_banner, console
-from .models import choose_provider_and_model
-from .repl import run_repl
 
 load_dotenv()
 
@@ -28,6 +25,11 @@ def main(
     Supports OpenAI and OpenRouter providers with encrypted credential storage.
     """
     if ctx.invoked_subcommand is None and "--help" not in sys.argv:
+        # Deferred so --help doesn't pay for the rich/openai/REPL stack.
+        from .display import show_banner, console
+        from .models import choose_provider_and_model
+        from .repl import run_repl
+
         show_banner()
         try:
             client, provider, model = choose_provider_and_model(reset=reset)
@@ -2,7 +2,8 @@
 
 import json
 from pathlib import Path
-from .crypto import encrypt_value, decrypt_value, SECRET_PATH
+from .crypto import encrypt_value, decrypt_value, clear_cached_keys, SECRET_PATH
+from .utils import write_private_file
 
 CONFIG_PATH = Path.home() / ".thoth_config.json"
 
@@ -28,11 +29,11 @@ def save_config(provider_name: str, api_key: str, model_name: str) -> None:
         "api_key": encrypt_value(api_key),
         "model": model_name,
     }
-    CONFIG_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
-    CONFIG_PATH.chmod(0o600)
+    write_private_file(CONFIG_PATH, json.dumps(data, indent=2))
 
 
 def reset_config() -> None:
     
     CONFIG_PATH.unlink(missing_ok=True)
-    SECRET_PATH.unlink(missing_ok=True)
\ No newline at end of file
+    SECRET_PATH.unlink(missing_ok=True)
+    clear_cached_keys()
\ No newline at end of file
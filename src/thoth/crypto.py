@@ -1,30 +1,139 @@
 
 
+import base64
+import os
 from pathlib import Path
-from cryptography.fernet import Fernet
+from typing import TYPE_CHECKING, List, Optional
+from .utils import write_private_file
+
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 SECRET_PATH = Path.home() / ".thoth_secret.key"
 
+# AES-GCM tokens carry this version byte; Fernet tokens start with 0x80,
+# which base64-encodes to "gAAAAA" and marks legacy values on read.
+_AESGCM_VERSION = b"\x01"
+_FERNET_PREFIX = "gAAAAA"
+_NONCE_SIZE = 12
+
+_KEY: Optional[bytes] = None
+_AESGCM: Optional["AESGCM"] = None
+_FERNET: Optional["Fernet"] = None
+
+
+def _get_key() -> bytes:
+
+    global _KEY
+    if _KEY is None:
+        if not SECRET_PATH.exists():
+            key = base64.urlsafe_b64encode(os.urandom(32))
+            write_private_file(SECRET_PATH, key)
+        else:
+            key = SECRET_PATH.read_bytes()
+        _KEY = key
+    return _KEY
+
+
+def get_aesgcm() -> "AESGCM":
+
+    # Imported on first use so startup paths that never touch secrets
+    # don't pay for loading the cryptography stack.
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    global _AESGCM
+    if _AESGCM is None:
+        _AESGCM = AESGCM(base64.urlsafe_b64decode(_get_key()))
+    return _AESGCM
+
+
+def get_fernet() -> "Fernet":
+
+    # Legacy cipher, kept for decrypting values written before the
+    # AES-GCM migration; the stored key doubles as a Fernet key.
+    from cryptography.fernet import Fernet
+
+    global _FERNET
+    if _FERNET is None:
+        _FERNET = Fernet(_get_key())
+    return _FERNET
 
-def get_fernet() -> Fernet:
-    
-    if not SECRET_PATH.exists():
-        key = Fernet.generate_key()
-        SECRET_PATH.write_bytes(key)
-        SECRET_PATH.chmod(0o600)
-    else:
-        key = SECRET_PATH.read_bytes()
-    return Fernet(key)
+
+def clear_cached_keys() -> None:
+
+    global _KEY, _AESGCM, _FERNET
+    _KEY = None
+    _AESGCM = None
+    _FERNET = None
 
 
 def encrypt_value(plaintext: str) -> str:
-    
-    return get_fernet().encrypt(plaintext.encode()).decode()
+
+    nonce = os.urandom(_NONCE_SIZE)
+    ciphertext = get_aesgcm().encrypt(nonce, plaintext.encode(), None)
+    return base64.urlsafe_b64encode(_AESGCM_VERSION + nonce + ciphertext).decode()
 
 
 def decrypt_value(ciphertext: str) -> str:
-    
+
+    if not ciphertext:
+        return ""
+
+    if ciphertext.startswith(_FERNET_PREFIX):
+        from cryptography.fernet import InvalidToken
+
+        try:
+            return get_fernet().decrypt(ciphertext.encode()).decode()
+        except InvalidToken:
+            return ""
+
     try:
-        return get_fernet().decrypt(ciphertext.encode()).decode()
+        raw = base64.urlsafe_b64decode(ciphertext.encode())
+        if not raw.startswith(_AESGCM_VERSION):
+            return ""
+        nonce = raw[1:1 + _NONCE_SIZE]
+        return get_aesgcm().decrypt(nonce, raw[1 + _NONCE_SIZE:], None).decode()
     except Exception:
-        return ""
\ No newline at end of file
+        return ""
+
+
+def encrypt_batch(plaintexts: List[str]) -> List[str]:
+    """Encrypt several values with the cipher resolved once up front."""
+    aesgcm = get_aesgcm() if plaintexts else None
+    tokens = []
+    for plaintext in plaintexts:
+        nonce = os.urandom(_NONCE_SIZE)
+        ciphertext = aesgcm.encrypt(nonce, plaintext.encode(), None)
+        tokens.append(
+            base64.urlsafe_b64encode(_AESGCM_VERSION + nonce + ciphertext).decode()
+        )
+    return tokens
+
+
+def decrypt_batch(ciphertexts: List[str]) -> List[str]:
+    """Decrypt several values with the cipher resolved once up front.
+
+    Order is preserved; undecryptable entries come back as "" exactly
+    like decrypt_value.
+    """
+    aesgcm = None
+    plaintexts = []
+    for ciphertext in ciphertexts:
+        if not ciphertext or ciphertext.startswith(_FERNET_PREFIX):
+            plaintexts.append(decrypt_value(ciphertext))
+            continue
+        if aesgcm is None:
+            aesgcm = get_aesgcm()
+        try:
+            raw = base64.urlsafe_b64decode(ciphertext.encode())
+            if not raw.startswith(_AESGCM_VERSION):
+                plaintexts.append("")
+                continue
+            nonce = raw[1:1 + _NONCE_SIZE]
+            plaintexts.append(
+                aesgcm.decrypt(nonce, raw[1 + _NONCE_SIZE:], None).decode()
+            )
+        except Exception:
+            plaintexts.append("")
+    return plaintexts
@@ -1,5 +1,6 @@
 
 
+from itertools import groupby
 from rich.align import Align
 from rich.color import Color
 from rich.console import Console
@@ -9,7 +10,12 @@ from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 from typing import Optional
-from .input import get_key
+from .input import get_key, get_key_nowait
+
+
+MAX_CONTINUOUS_EVENTS = 10
+
+GRADIENT_BUCKETS = 16
 
 BANNER = """
 ████████╗ ██╗  ██╗  ▄▄■■■■■▄▄ ▀██████╗ ██╗  ██╗
@@ -21,29 +27,51 @@ BANNER = """
 """
 TAGLINE = "𓅞  Desireth thou to know the deep, hidden secret? 𓅞"
 
+_BANNER_LINES = BANNER.strip().split("\n")
+_MAX_WIDTH = max(map(len, _BANNER_LINES))
+_GRADIENT_START = Color.parse("#332701").triplet
+_GRADIENT_END = Color.parse("#C2A14A").triplet
+
 console = Console()
 
+_BANNER_TEXT: Optional[Text] = None
+
 
 def show_banner() -> None:
-    
-    banner_lines = BANNER.strip().split("\n")
-    start_color = Color.parse("#332701").triplet
-    end_color = Color.parse("#C2A14A").triplet
-    max_width = max(len(line) for line in banner_lines)
-
-    def color_for_position(col: int) -> str:
-        ratio = col / (max_width - 1) if max_width > 1 else 0
-        r = int(start_color[0] + (end_color[0] - start_color[0]) * ratio)
-        g = int(start_color[1] + (end_color[1] - start_color[1]) * ratio)
-        b = int(start_color[2] + (end_color[2] - start_color[2]) * ratio)
-        return f"#{r:02x}{g:02x}{b:02x}"
+
+    global _BANNER_TEXT
+
+    # Skip the paint entirely for piped/scripted runs.
+    if not console.is_terminal:
+        return
+
+    if _BANNER_TEXT is not None:
+        console.print(Align.center(_BANNER_TEXT))
+        console.print(Align.center(Text(TAGLINE, style="italic #BDB76B")))
+        console.print()
+        return
+
+    # Quantize the gradient to a small palette and emit one styled span
+    # per run of identical color, instead of one span per character.
+    palette = []
+    for bucket in range(GRADIENT_BUCKETS):
+        ratio = bucket / (GRADIENT_BUCKETS - 1)
+        r = int(_GRADIENT_START[0] + (_GRADIENT_END[0] - _GRADIENT_START[0]) * ratio)
+        g = int(_GRADIENT_START[1] + (_GRADIENT_END[1] - _GRADIENT_START[1]) * ratio)
+        b = int(_GRADIENT_START[2] + (_GRADIENT_END[2] - _GRADIENT_START[2]) * ratio)
+        palette.append(Style(color=f"#{r:02x}{g:02x}{b:02x}"))
+
+    def bucket_for(col: int) -> int:
+        return col * GRADIENT_BUCKETS // _MAX_WIDTH
 
     styled = Text()
-    for line in banner_lines:
-        for col, char in enumerate(line):
-            styled.append(char, style=Style(color=color_for_position(col)))
+    for line in _BANNER_LINES:
+        for bucket, cols in groupby(range(len(line)), key=bucket_for):
+            run = list(cols)
+            styled.append(line[run[0]:run[-1] + 1], style=palette[bucket])
         styled.append("\n")
-    
+
+    _BANNER_TEXT = styled
     console.print(Align.center(styled))
     console.print(Align.center(Text(TAGLINE, style="italic #BDB76B")))
     console.print()
@@ -81,17 +109,28 @@ def select_with_arrows(
         while True:
             try:
                 key = get_key()
-                
-                if key == "up":
-                    selected_index = (selected_index - 1) % len(option_keys)
-                    live.update(create_panel(), refresh=True)
-                elif key == "down":
-                    selected_index = (selected_index + 1) % len(option_keys)
+                dirty = False
+
+                # Drain queued key-repeat events so a held arrow key
+                # produces one redraw per batch instead of one per event.
+                for _ in range(MAX_CONTINUOUS_EVENTS):
+                    if key == "up":
+                        selected_index = (selected_index - 1) % len(option_keys)
+                        dirty = True
+                    elif key == "down":
+                        selected_index = (selected_index + 1) % len(option_keys)
+                        dirty = True
+                    elif key == "enter":
+                        return option_keys[selected_index]
+                    elif key == "escape":
+                        return None
+
+                    key = get_key_nowait()
+                    if key is None:
+                        break
+
+                if dirty:
                     live.update(create_panel(), refresh=True)
-                elif key == "enter":
-                    return option_keys[selected_index]
-                elif key == "escape":
-                    return None
             except KeyboardInterrupt:
                 return None
 
@@ -115,28 +154,41 @@ def select_model_interactive(
         return None
 
     search_query = ""
+    # Lowercase once; appending to the query can only narrow the current
+    # match set, so those keystrokes filter the previous indices instead
+    # of rescanning the full model list.
+    lower_models = [m.lower() for m in model_list]
+    filtered_indices = list(range(len(model_list)))
     filtered = model_list.copy()
     page = 0
     selected_index = 0
 
-    def total_pages() -> int:
-        return max(1, (len(filtered) + per_page - 1) // per_page)
+    # Pagination state is derived only when filtered/page actually
+    # change, instead of being recomputed several times per key event.
+    num_pages = max(1, (len(filtered) + per_page - 1) // per_page)
+    page_items = filtered[:per_page]
 
-    def get_page_items() -> list[str]:
-        start = page * per_page
-        return filtered[start:start + per_page]
+    panel_cache: dict[tuple, Panel] = {}
 
     def create_panel() -> Panel:
+        # Rendered panels are pure functions of the selector state, so
+        # revisiting a page/selection/query combination reuses the old
+        # Panel. Console size is part of the key to survive resizes.
+        cache_key = (page, selected_index, search_query, console.size)
+        cached = panel_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         tbl = Table.grid(padding=(0, 1))
         tbl.add_column(width=3, style="cyan")
         tbl.add_column(style="white", ratio=1)
-        
-        for i, model_name in enumerate(get_page_items()):
+
+        for i, model_name in enumerate(page_items):
             prefix = "▶" if i == selected_index else " "
             tbl.add_row(prefix, f"[cyan]{model_name}[/cyan]")
-        
+
         info = (
-            f"Page {page + 1}/{total_pages()} • "
+            f"Page {page + 1}/{num_pages} • "
             f"{len(filtered)} models • "
             f"Search: [bold]{search_query or '—'}[/bold]"
         )
@@ -144,46 +196,63 @@ def select_model_interactive(
             "[dim]↑/↓ select • ←/→ page • type to search • "
             "BACKSPACE to edit • Enter to choose • ctrl^C to cancel[/dim]"
         )
-        return Panel(
+        panel = Panel(
             tbl,
             title="Choose Model",
             subtitle=f"{info}\n{footer}",
             border_style="#B8860B"
         )
+        panel_cache[cache_key] = panel
+        return panel
 
     with Live(create_panel(), console=console, transient=True, auto_refresh=False) as live:
         while True:
             key = get_key()
-            page_items = get_page_items()
-            
-            if key == "up":
-                selected_index = (selected_index - 1) % min(per_page, len(page_items) or 1)
-            elif key == "down":
-                selected_index = (selected_index + 1) % min(per_page, len(page_items) or 1)
-            elif key == "left" and page > 0:
-                page -= 1
-                selected_index = 0
-            elif key == "right" and page < total_pages() - 1:
-                page += 1
-                selected_index = 0
-            elif key == "backspace" and search_query:
-                search_query = search_query[:-1]
-                filtered = [m for m in model_list if search_query.lower() in m.lower()]
-                page = 0
-                selected_index = 0
-            elif key == "enter":
-                return page_items[selected_index] if page_items else None
-            elif key == "escape":
-                return None
-            elif isinstance(key, str) and len(key) == 1 and key.isprintable():
-                search_query += key
-                filtered = [m for m in model_list if search_query.lower() in m.lower()]
-                page = 0
-                selected_index = 0
-            
-            
-            if page >= total_pages():
-                page = max(0, total_pages() - 1)
-                selected_index = 0
-            
-            live.update(create_panel(), refresh=True)
\ No newline at end of file
+            prev_state = (page, selected_index, search_query)
+
+            # Drain queued key-repeat/typing events before rendering so
+            # held arrows and fast search typing batch into one redraw.
+            for _ in range(MAX_CONTINUOUS_EVENTS):
+                if key == "up":
+                    selected_index = (selected_index - 1) % min(per_page, len(page_items) or 1)
+                elif key == "down":
+                    selected_index = (selected_index + 1) % min(per_page, len(page_items) or 1)
+                elif key == "left" and page > 0:
+                    page -= 1
+                    selected_index = 0
+                    page_items = filtered[page * per_page:(page + 1) * per_page]
+                elif key == "right" and page < num_pages - 1:
+                    page += 1
+                    selected_index = 0
+                    page_items = filtered[page * per_page:(page + 1) * per_page]
+                elif key == "backspace" and search_query:
+                    search_query = search_query[:-1]
+                    q = search_query.lower()
+                    filtered_indices = [i for i in range(len(model_list)) if q in lower_models[i]]
+                    filtered = [model_list[i] for i in filtered_indices]
+                    num_pages = max(1, (len(filtered) + per_page - 1) // per_page)
+                    page = 0
+                    selected_index = 0
+                    page_items = filtered[:per_page]
+                elif key == "enter":
+                    return page_items[selected_index] if page_items else None
+                elif key == "escape":
+                    return None
+                elif isinstance(key, str) and len(key) == 1 and key.isprintable():
+                    search_query += key
+                    q = search_query.lower()
+                    filtered_indices = [i for i in filtered_indices if q in lower_models[i]]
+                    filtered = [model_list[i] for i in filtered_indices]
+                    num_pages = max(1, (len(filtered) + per_page - 1) // per_page)
+                    page = 0
+                    selected_index = 0
+                    page_items = filtered[:per_page]
+
+                key = get_key_nowait()
+                if key is None:
+                    break
+
+            # No-op keys (unknown keys, left at page 0, ...) leave the
+            # state untouched; skip the panel rebuild entirely then.
+            if (page, selected_index, search_query) != prev_state:
+                live.update(create_panel(), refresh=True)
\ No newline at end of file
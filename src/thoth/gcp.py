@@ -1,13 +1,25 @@
+import copy
 import json
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+try:
+    import ssrjson
+except ImportError:
+    ssrjson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from typing import Optional, Dict, Any, List
 from rich.panel import Panel
 from rich.table import Table
-from prompt_toolkit import prompt
-from prompt_toolkit.formatted_text import HTML
 from .display import console, select_with_arrows
 from .crypto import encrypt_value, decrypt_value
+from .utils import write_private_file
 
 GCP_CONFIG_PATH = Path.home() / ".thoth_gcp_config.json"
 
@@ -37,81 +49,92 @@ GCP_REGIONS = {
 }
 
 
+_ZONES_BY_REGION = {
+    region: {f"{region}-{suffix}": f"{region}-{suffix}" for suffix in "abcdef"}
+    for region in GCP_REGIONS.values()
+}
+
+
 def get_zones_for_region(region: str) -> Dict[str, str]:
-    
-    
-    zones = {}
-    for suffix in ['a', 'b', 'c', 'd', 'e', 'f']:
-        zone = f"{region}-{suffix}"
-        zones[f"{zone}"] = zone
-    return zones
 
+    return _ZONES_BY_REGION.get(region, {})
 
-def check_gcloud_auth() -> Optional[Dict[str, str]]:
+
+_AUTH_LIST_CACHE: Optional[tuple[float, List[Dict[str, str]]]] = None
+_AUTH_LIST_TTL = 5.0
+
+
+def _gcloud_auth_list(force: bool = False) -> List[Dict[str, str]]:
     """
-    Check if user is authenticated with gcloud and return account info.
-    
+    Run `gcloud auth list` once and cache the result for a short TTL.
+
+    Every gcloud invocation spawns a full CLI process, so the account
+    helpers below all share this single cached call.
+
+    Args:
+        force: If True, bypass the cache and re-run the command
+
     Returns:
-        Dict with account info if authenticated, None otherwise
+        List of account dicts with account and status
     """
+    global _AUTH_LIST_CACHE
+
+    if not force and _AUTH_LIST_CACHE is not None:
+        cached_at, accounts = _AUTH_LIST_CACHE
+        if time.monotonic() - cached_at < _AUTH_LIST_TTL:
+            return accounts
+
     try:
+        # value(...) emits tab-separated plain text, so the two fields we
+        # need parse with a splitlines() instead of a JSON decode.
         result = subprocess.run(
-            ["gcloud", "auth", "list", "--format=json"],
+            ["gcloud", "auth", "list", "--format=value(account,status)"],
             capture_output=True,
             text=True,
             timeout=10
         )
-        
+
         if result.returncode != 0:
-            return None
-        
-        accounts = json.loads(result.stdout)
-        
-        # Find active account
-        active_account = None
-        for account in accounts:
-            if account.get("status") == "ACTIVE":
-                active_account = {
-                    "email": account.get("account"),
-                    "status": account.get("status")
-                }
-                break
-        
-        return active_account
-        
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
-        return None
+            return []
+
+        accounts = [
+            dict(zip(("account", "status"), line.split("\t")))
+            for line in result.stdout.splitlines() if line
+        ]
+        _AUTH_LIST_CACHE = (time.monotonic(), accounts)
+        return accounts
+
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return []
     except Exception as e:
-        console.print(f"[yellow]Error checking gcloud auth: {e}[/yellow]")
-        return None
+        console.print(f"[yellow]Error getting accounts: {e}[/yellow]")
+        return []
+
+
+def check_gcloud_auth() -> Optional[Dict[str, str]]:
+    """
+    Check if user is authenticated with gcloud and return account info.
+
+    Returns:
+        Dict with account info if authenticated, None otherwise
+    """
+    for account in _gcloud_auth_list():
+        if account.get("status") == "ACTIVE":
+            return {
+                "email": account.get("account"),
+                "status": account.get("status")
+            }
+    return None
 
 
 def get_all_gcloud_accounts() -> List[Dict[str, str]]:
     """
     Get all gcloud accounts.
-    
+
     Returns:
         List of account dicts with email and status
     """
-    try:
-        result = subprocess.run(
-            ["gcloud", "auth", "list", "--format=json"],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        if result.returncode != 0:
-            return []
-        
-        accounts = json.loads(result.stdout)
-        return accounts
-        
-    except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError):
-        return []
-    except Exception as e:
-        console.print(f"[yellow]Error getting accounts: {e}[/yellow]")
-        return []
+    return _gcloud_auth_list()
 
 
 def switch_gcloud_account(account_email: str) -> bool:
@@ -133,6 +156,7 @@ def switch_gcloud_account(account_email: str) -> bool:
         )
         
         if result.returncode == 0:
+            _gcloud_auth_list(force=True)
             return True
         else:
             console.print(f"[red]Failed to switch account: {result.stderr}[/red]")
@@ -161,6 +185,7 @@ def prompt_gcloud_login() -> bool:
         
         if result.returncode == 0:
             console.print("\n[green]✓ Authentication successful![/green]\n")
+            _gcloud_auth_list(force=True)
             return True
         else:
             console.print("\n[red]✗ Authentication failed[/red]\n")
@@ -300,16 +325,107 @@ def run_gcloud_command(args: List[str], project_id: Optional[str] = None) -> Opt
         return None
 
 
+# Maps the service-account key plaintext to its stored ciphertext so a
+# load/save round-trip with an unchanged key skips the re-encrypt.
+_SA_KEY_CACHE: Optional[tuple[str, str]] = None
+
+
+def json_loads(data) -> Any:
+    """Parse JSON bytes/str with the fastest parser installed: ssrjson
+    (SIMD tokenizer), then orjson (C parser, no separate UTF-8 decode
+    pass), then stdlib json."""
+    if ssrjson is not None:
+        return ssrjson.loads(data)
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Serialize to a compact JSON str with the fastest serializer
+    installed, mirroring json_loads."""
+    if ssrjson is not None:
+        return ssrjson.dumps(obj)
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def run_gcloud_json(args: List[str], project_id: Optional[str] = None) -> Optional[Any]:
+    """
+    Run a gcloud command and parse its JSON output.
+
+    Runs without text=True so stdout stays raw bytes for the parser,
+    skipping the redundant UTF-8 decode pass.
+
+    Args:
+        args: List of gcloud command arguments (should include --format=json)
+        project_id: Optional project ID to use
+
+    Returns:
+        Parsed JSON value, or None if the command failed
+    """
+    try:
+        cmd = ['gcloud'] + args
+
+        if project_id and '--project' not in args:
+            cmd.extend(['--project', project_id])
+
+        result = subprocess.run(
+            cmd,
+            capture_output=True,
+            timeout=30
+        )
+
+        if result.returncode != 0:
+            console.print(f"[red]gcloud error:[/red] {result.stderr.decode(errors='replace')}")
+            return None
+
+        return json_loads(result.stdout) if result.stdout.strip() else []
+    except subprocess.TimeoutExpired:
+        console.print("[red]gcloud command timed out[/red]")
+        return None
+    except FileNotFoundError:
+        console.print("[red]gcloud CLI not found. Please install Google Cloud SDK.[/red]")
+        return None
+    except ValueError:
+        console.print("[red]Could not parse gcloud JSON output[/red]")
+        return None
+    except Exception as e:
+        console.print(f"[red]Error running gcloud: {e}[/red]")
+        return None
+
+
+# Parsed-and-decrypted config keyed by (mtime_ns, size), same scheme as
+# load_mcp_config: the REPL calls load_gcp_config several times per chat
+# turn, and each repeat costs one stat instead of a read + parse +
+# decrypt. Callers get a copy to mutate freely.
+_CONFIG_CACHE: Optional[tuple] = None
+
+
 def load_gcp_config() -> Dict[str, Any]:
-    
-    if not GCP_CONFIG_PATH.exists():
+
+    global _SA_KEY_CACHE, _CONFIG_CACHE
+
+    try:
+        st = GCP_CONFIG_PATH.stat()
+    except FileNotFoundError:
         return {}
-    
+
+    stat_key = (st.st_mtime_ns, st.st_size)
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == stat_key:
+        return copy.deepcopy(_CONFIG_CACHE[1])
+
     try:
         data = json.loads(GCP_CONFIG_PATH.read_text(encoding="utf-8"))
-        
-        if data.get("service_account_key"):
-            data["service_account_key"] = decrypt_value(data["service_account_key"])
+
+        stored = data.get("service_account_key")
+        if stored:
+            ciphertext = stored[10:] if stored.startswith("encrypted:") else stored
+            plaintext = decrypt_value(ciphertext)
+            data["service_account_key"] = plaintext
+            _SA_KEY_CACHE = (plaintext, ciphertext)
+        _CONFIG_CACHE = (stat_key, copy.deepcopy(data))
         return data
     except Exception as e:
         console.print(f"[red]Error loading GCP config: {e}[/red]")
@@ -317,19 +433,29 @@ def load_gcp_config() -> Dict[str, Any]:
 
 
 def save_gcp_config(config: Dict[str, Any]) -> None:
-    
+
+    global _SA_KEY_CACHE, _CONFIG_CACHE
+
     config_copy = config.copy()
-    
-    
-    if config_copy.get("service_account_key"):
-        config_copy["service_account_key"] = f"encrypted:{encrypt_value(config_copy['service_account_key'])}"
-    
-    GCP_CONFIG_PATH.write_text(json.dumps(config_copy, indent=2), encoding="utf-8")
-    GCP_CONFIG_PATH.chmod(0o600)
+
+    plaintext = config_copy.get("service_account_key")
+    if plaintext:
+        if _SA_KEY_CACHE is not None and _SA_KEY_CACHE[0] == plaintext:
+            ciphertext = _SA_KEY_CACHE[1]
+        else:
+            ciphertext = encrypt_value(plaintext)
+            _SA_KEY_CACHE = (plaintext, ciphertext)
+        config_copy["service_account_key"] = f"encrypted:{ciphertext}"
+
+    write_private_file(GCP_CONFIG_PATH, json.dumps(config_copy, indent=2))
+    _CONFIG_CACHE = None
 
 
 def configure_gcp_interactive() -> None:
-    
+
+    from prompt_toolkit import prompt
+    from prompt_toolkit.formatted_text import HTML
+
     config = load_gcp_config()
     
     while True:
@@ -414,8 +540,15 @@ def configure_gcp_interactive() -> None:
                     key_file = Path(key_path).expanduser()
                     if key_file.exists():
                         key_content = key_file.read_text()
-                        
-                        json.loads(key_content)
+
+                        # Cheap shape/size check instead of a full JSON
+                        # parse whose result is immediately discarded;
+                        # real validation happens when the key is used.
+                        if (not key_content.lstrip().startswith("{")
+                                or len(key_content) > 1 << 16):
+                            raise json.JSONDecodeError(
+                                "Not a service account key file", key_content, 0
+                            )
                         config["service_account_key"] = key_content
                         save_gcp_config(config)
                         console.print(f"[green]✓ Service account key saved[/green]\n")
@@ -441,74 +574,73 @@ def configure_gcp_interactive() -> None:
 
 
 def test_gcloud_connection(config: Dict[str, Any]) -> None:
-    
+
     console.print("\n[dim]Testing gcloud connection...[/dim]\n")
-    
-    
-    try:
+
+    def probe_version() -> bool:
+        try:
+            result = subprocess.run(
+                ['gcloud', 'version'],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
+            return result.returncode == 0
+        except Exception:
+            return False
+
+    def probe_project(pid: str) -> bool:
         result = subprocess.run(
-            ['gcloud', 'version'],
+            ['gcloud', 'projects', 'describe', pid, '--format=json'],
             capture_output=True,
             text=True,
-            timeout=5
+            timeout=10
         )
-        
-        if result.returncode != 0:
+        return result.returncode == 0
+
+    project_id = config.get("project_id")
+
+    # The three probes are independent subprocess spawns; run them
+    # concurrently and report in the original order.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        version_future = executor.submit(probe_version)
+        auth_future = executor.submit(_gcloud_auth_list)
+        project_future = executor.submit(probe_project, project_id) if project_id else None
+
+        if not version_future.result():
             console.print("[red]✗ gcloud CLI not found[/red]")
             console.print("[dim]Install: https://cloud.google.com/sdk/docs/install[/dim]\n")
             return
-        
+
         console.print("[green]✓ gcloud CLI installed[/green]")
-    except Exception:
-        console.print("[red]✗ gcloud CLI not found[/red]")
-        console.print("[dim]Install: https://cloud.google.com/sdk/docs/install[/dim]\n")
-        return
-    
-    
-    result = subprocess.run(
-        ['gcloud', 'auth', 'list', '--format=json'],
-        capture_output=True,
-        text=True,
-        timeout=5
-    )
-    
-    if result.returncode == 0:
-        try:
-            accounts = json.loads(result.stdout)
-            if accounts:
-                active_account = None
-                for account in accounts:
-                    if account.get("status") == "ACTIVE":
-                        active_account = account.get("account")
-                        break
-                
-                if active_account:
-                    console.print(f"[green]✓ Authenticated as: {active_account}[/green]")
-                else:
-                    console.print(f"[green]✓ Authenticated ({len(accounts)} account(s))[/green]")
-            else:
-                console.print("[yellow]⚠ Not authenticated[/yellow]")
-                console.print("[dim]Run: gcloud auth login[/dim]")
-        except:
-            console.print("[yellow]⚠ Could not verify authentication[/yellow]")
+
+        accounts = auth_future.result()
+        project_ok = project_future.result() if project_future else False
+
+    if accounts:
+        active_account = None
+        for account in accounts:
+            if account.get("status") == "ACTIVE":
+                active_account = account.get("account")
+                break
+
+        if active_account:
+            console.print(f"[green]✓ Authenticated as: {active_account}[/green]")
+        else:
+            console.print(f"[green]✓ Authenticated ({len(accounts)} account(s))[/green]")
+    else:
+        console.print("[yellow]⚠ Not authenticated[/yellow]")
+        console.print("[dim]Run: gcloud auth login[/dim]")
     
     
-    project_id = config.get("project_id")
     if project_id:
-        result = subprocess.run(
-            ['gcloud', 'projects', 'describe', project_id, '--format=json'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        if result.returncode == 0:
+        if project_ok:
             console.print(f"[green]✓ Project '{project_id}' accessible[/green]")
         else:
             console.print(f"[yellow]⚠ Cannot access project '{project_id}'[/yellow]")
     else:
         console.print("[dim]○ No project configured[/dim]")
-    
+
     console.print()
 
 
@@ -599,8 +731,80 @@ def reset_gcp_config() -> None:
 
 
 
+GCLOUD_TOKEN_PATH = Path.home() / ".thoth_gcloud_token.json"
+
+_ACCESS_TOKEN_CACHE: Optional[tuple[str, float]] = None
+
+
+def _get_access_token() -> Optional[str]:
+    """
+    Get a gcloud access token, cached in memory and on disk with its
+    expiry so repeat REST calls skip the ~1 s gcloud process spawn.
+
+    Returns:
+        Bearer token string, or None if gcloud auth is unavailable
+    """
+    global _ACCESS_TOKEN_CACHE
+
+    if _ACCESS_TOKEN_CACHE is not None and time.time() < _ACCESS_TOKEN_CACHE[1]:
+        return _ACCESS_TOKEN_CACHE[0]
+
+    if GCLOUD_TOKEN_PATH.exists():
+        try:
+            cached = json.loads(GCLOUD_TOKEN_PATH.read_text(encoding="utf-8"))
+            if time.time() < cached.get("expires_at", 0):
+                _ACCESS_TOKEN_CACHE = (cached["token"], cached["expires_at"])
+                return cached["token"]
+        except Exception:
+            pass
+
+    try:
+        result = subprocess.run(
+            ["gcloud", "auth", "print-access-token"],
+            capture_output=True,
+            text=True,
+            timeout=15
+        )
+        if result.returncode != 0:
+            return None
+
+        token = result.stdout.strip()
+        # gcloud tokens last ~60 min; refresh slightly early.
+        expires_at = time.time() + 3300
+        _ACCESS_TOKEN_CACHE = (token, expires_at)
+        write_private_file(
+            GCLOUD_TOKEN_PATH,
+            json.dumps({"token": token, "expires_at": expires_at})
+        )
+        return token
+    except Exception:
+        return None
+
+
+def _gcp_rest_get(url: str) -> Optional[Any]:
+    """GET a GCP REST endpoint with the cached bearer token; returns the
+    parsed JSON body or None so callers can fall back to the CLI."""
+    token = _get_access_token()
+    if not token:
+        return None
+
+    import requests
+
+    try:
+        response = requests.get(
+            url,
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=15
+        )
+        if response.status_code == 200:
+            return response.json()
+    except requests.exceptions.RequestException:
+        pass
+    return None
+
+
 def list_gcp_instances(project_id: str) -> Optional[str]:
-    
+
     return run_gcloud_command(
         ['compute', 'instances', 'list', '--format=table(name,zone,machineType,status,networkInterfaces[0].accessConfigs[0].natIP:label=EXTERNAL_IP)'],
         project_id=project_id
@@ -608,7 +812,16 @@ def list_gcp_instances(project_id: str) -> Optional[str]:
 
 
 def describe_gcp_instance(instance_name: str, zone: str, project_id: str) -> Optional[str]:
-    
+
+    # REST round trip on a warm token beats a gcloud process cold start
+    # by an order of magnitude; fall back to the CLI when unauthorized.
+    data = _gcp_rest_get(
+        f"https://compute.googleapis.com/compute/v1/projects/{project_id}"
+        f"/zones/{zone}/instances/{instance_name}"
+    )
+    if data is not None:
+        return json.dumps(data, indent=2)
+
     return run_gcloud_command(
         ['compute', 'instances', 'describe', instance_name, '--zone', zone],
         project_id=project_id
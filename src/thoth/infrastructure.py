@@ -1,205 +1,422 @@
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Confirm
 from .display import console, select_with_arrows
-from .gcp import load_gcp_config, run_gcloud_command
+from .gcp import load_gcp_config, run_gcloud_command, run_gcloud_json, json_loads
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# On-demand parser for the knowledge viewer: sections the user never
+# opens are skipped instead of being materialized into Python objects.
+_SIMD_PARSER = simdjson.Parser() if simdjson is not None else None
+
+# Knowledge JSON compresses 10-20x (repeated field names, URL prefixes),
+# so storing it as .json.zst trades a fast compress for most of the disk
+# I/O. Level 3 decompresses faster than re-parsing indented JSON.
+_ZSTD_C = zstd.ZstdCompressor(level=3) if zstd is not None else None
+_ZSTD_D = zstd.ZstdDecompressor() if zstd is not None else None
+
+
+def _read_knowledge_file(path: Path) -> Dict[str, Any]:
+
+    data = path.read_bytes()
+    if path.suffix == ".zst":
+        data = _ZSTD_D.decompress(data)
+    return json_loads(data)
+
+
+def _load_knowledge_lazy(path: Path):
+    """Parse for section-at-a-time access.
+
+    With pysimdjson installed this returns a lazy document whose
+    subtrees are only converted to Python objects when indexed, so the
+    viewer pays for the one section the user opens. Falls back to the
+    eager parse otherwise; both results support get()/[]/iteration.
+
+    The document borrows the shared parser's buffer, so callers must
+    drop it before the next _load_knowledge_lazy call.
+    """
+    data = path.read_bytes()
+    if path.suffix == ".zst":
+        data = _ZSTD_D.decompress(data)
+    if _SIMD_PARSER is not None:
+        return _SIMD_PARSER.parse(data)
+    return json_loads(data)
+
+
+def _json_default(obj):
+
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_knowledge_file(path: Path, knowledge: Dict[str, Any]) -> None:
+
+    # orjson serializes the datetime timestamp natively (RFC 3339 in C);
+    # the stdlib path formats it through _json_default.
+    if orjson is not None:
+        data = orjson.dumps(knowledge, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(knowledge, indent=2, default=_json_default).encode("utf-8")
+    if path.suffix == ".zst":
+        data = _ZSTD_C.compress(data)
+    path.write_bytes(data)
+
+
+_KNOWLEDGE_DIR = Path.home() / ".thoth_knowledge"
+_dir_ready = False
+
+
+def _ensure_knowledge_dir() -> None:
+
+    global _dir_ready
+    if not _dir_ready:
+        _KNOWLEDGE_DIR.mkdir(exist_ok=True)
+        _dir_ready = True
+
+
+@lru_cache(maxsize=32)
 def get_knowledge_file_path(project_id: str) -> Path:
-    
-    knowledge_dir = Path.home() / ".thoth_knowledge"
-    knowledge_dir.mkdir(exist_ok=True)
-    return knowledge_dir / f"{project_id}_infrastructure.json"
+    # Cached per project: callers hit this back-to-back in a session and
+    # each uncached call cost a mkdir/exists stat pair.
+    _ensure_knowledge_dir()
+    plain = _KNOWLEDGE_DIR / f"{project_id}_infrastructure.json"
+    # Keep reading (and rewriting) pre-existing uncompressed files so
+    # knowledge written before zstandard was installed stays usable.
+    if zstd is None or plain.exists():
+        return plain
+    return _KNOWLEDGE_DIR / f"{project_id}_infrastructure.json.zst"
+
+
+# Knowledge-file mtimes by project id (None = known absent). Only the
+# writers in this module touch these files, so presence checks answer
+# from here instead of re-statting per menu action.
+_KNOWLEDGE_MTIME: Dict[str, Optional[int]] = {}
+
+
+def _note_knowledge_written(project_id: str, path: Path) -> None:
+
+    try:
+        _KNOWLEDGE_MTIME[project_id] = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        _KNOWLEDGE_MTIME[project_id] = None
 
 
 def has_stored_knowledge(project_id: str) -> bool:
-    
+
+    if project_id in _KNOWLEDGE_MTIME:
+        return _KNOWLEDGE_MTIME[project_id] is not None
+
     knowledge_file = get_knowledge_file_path(project_id)
-    return knowledge_file.exists()
+    try:
+        _KNOWLEDGE_MTIME[project_id] = os.stat(knowledge_file).st_mtime_ns
+        return True
+    except FileNotFoundError:
+        _KNOWLEDGE_MTIME[project_id] = None
+        return False
+
+
+_INSTANCE_FIELDS = ("name", "zone", "machine_type", "status",
+                    "internal_ip", "external_ip", "tags")
+
+
+def _instance_count(ci) -> int:
+    """Instance count for either layout: the parallel-array form written
+    now (a mapping, possibly a lazy simdjson object), or the legacy
+    list-of-dicts form from older knowledge files.
+
+    Layouts are told apart by the mapping interface, not isinstance:
+    the lazy parser hands legacy files back as a simdjson Array, which
+    is not a list but must still take the legacy branch."""
+    if hasattr(ci, "keys"):
+        return len(ci["name"])
+    return len(ci)
+
+
+def _iter_instances(ci):
+    """Yield one field tuple per instance, in _INSTANCE_FIELDS order,
+    from either knowledge layout (see _instance_count on detection)."""
+    if hasattr(ci, "keys"):
+        yield from zip(*(ci[f] for f in _INSTANCE_FIELDS))
+    else:
+        for vm in ci:
+            yield tuple(vm.get(f) for f in _INSTANCE_FIELDS)
+
+
+def _basename(s: str) -> str:
+    """Last path segment of a GCP resource URL, without the list that
+    split("/") would allocate for the six-plus segments we discard."""
+    return s.rpartition("/")[2] if s else s
+
+
+# value(...) emits one tab-separated row per resource with only the
+# projected fields, so gcloud sends 5-10x fewer bytes than --format=json
+# and the "parse" is a splitlines + split("\t").
+_INSTANCE_PROJECTION = (
+    "value(name,zone.basename(),machineType.basename(),status,"
+    "networkInterfaces[0].networkIP,"
+    "networkInterfaces[0].accessConfigs[0].natIP,"
+    'tags.items.list(separator="|"))'
+)
+
+
+def _fetch_instances(project_id: str) -> Optional[Dict[str, list]]:
+    """Fetch compute instances into parallel per-field arrays; None if
+    the call failed.
+
+    Struct-of-arrays beats a list of per-VM dicts here: no ~300-byte
+    dict overhead per row, no repeated key strings in the knowledge
+    file, and consumers iterate plain str lists.
+    """
+    output = run_gcloud_command(
+        ["compute", "instances", "list", f"--format={_INSTANCE_PROJECTION}"],
+        project_id=project_id
+    )
+
+    if output is None:
+        return None
+
+    result: Dict[str, list] = {f: [] for f in _INSTANCE_FIELDS}
+    for row in output.splitlines():
+        if not row:
+            continue
+        name, zone, machine_type, status, internal_ip, external_ip, tags = \
+            row.split("\t")
+        result["name"].append(name)
+        result["zone"].append(zone)
+        result["machine_type"].append(machine_type)
+        result["status"].append(status)
+        result["internal_ip"].append(internal_ip or None)
+        result["external_ip"].append(external_ip or None)
+        result["tags"].append(tags.split("|") if tags else [])
+
+    return result
+
+
+def _fetch_networks(project_id: str) -> Optional[list]:
+    """Fetch networks with their subnets; None if the call failed."""
+    output = run_gcloud_command(
+        ["compute", "networks", "list",
+         "--format=value(name,autoCreateSubnetworks)"],
+        project_id=project_id
+    )
+
+    if output is None:
+        return None
+
+    networks = [row.split("\t") for row in output.splitlines() if row]
+
+    def fetch_subnets(network_name: str) -> list:
+        subnet_output = run_gcloud_command(
+            ["compute", "networks", "subnets", "list",
+             f"--network={network_name}",
+             "--format=value(name,region.basename(),ipCidrRange)"],
+            project_id=project_id
+        )
+
+        if not subnet_output:
+            return []
+
+        return [
+            dict(zip(("name", "region", "ip_range"), row.split("\t")))
+            for row in subnet_output.splitlines() if row
+        ]
+
+    # Subnet lists are independent per network; fan them out too.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        subnet_lists = list(
+            pool.map(fetch_subnets, [name for name, _ in networks])
+        )
+
+    return [
+        {
+            "name": name,
+            "auto_create_subnetworks": auto_create == "True",
+            "subnets": subnet_lists[i]
+        }
+        for i, (name, auto_create) in enumerate(networks)
+    ]
+
+
+def _fetch_firewall_rules(project_id: str) -> Optional[list]:
+    """Fetch firewall rules; None if the call failed."""
+    rules = run_gcloud_json(
+        ["compute", "firewall-rules", "list", "--format=json"],
+        project_id=project_id
+    )
+
+    if rules is None:
+        return None
+
+    return [
+        {
+            "name": rule.get("name"),
+            "network": _basename(rule.get("network", "")),
+            "direction": rule.get("direction"),
+            "priority": rule.get("priority"),
+            "action": "ALLOW" if rule.get("allowed") else "DENY",
+            "source_ranges": rule.get("sourceRanges", []),
+            "target_tags": rule.get("targetTags", []),
+            "allowed": rule.get("allowed", []),
+            "denied": rule.get("denied", [])
+        }
+        for rule in rules
+    ]
+
+
+def _fetch_load_balancers(project_id: str) -> Optional[list]:
+    """Fetch forwarding rules; None if the call failed."""
+    output = run_gcloud_command(
+        ["compute", "forwarding-rules", "list",
+         "--format=value(name,loadBalancingScheme,IPAddress,"
+         "region.basename(),target.basename())"],
+        project_id=project_id
+    )
+
+    if output is None:
+        return None
+
+    result = []
+    for row in output.splitlines():
+        if not row:
+            continue
+        name, scheme, ip_address, region, target = row.split("\t")
+        result.append({
+            "name": name,
+            "type": scheme,
+            "ip_address": ip_address,
+            "region": region or "global",
+            "target": target
+        })
+
+    return result
+
+
+def _print_flat_table(title: str, columns: list, rows: list) -> None:
+    """Print an aligned listing as preformatted lines.
+
+    Rich's Table measures every cell to size its columns, which
+    dominates render time for hundred-row listings. Here the widths are
+    computed in one preflight pass and the whole table goes out as a
+    single print of padded markup lines.
+
+    Args:
+        title: Listing title
+        columns: List of (header, style) pairs
+        rows: List of per-row string tuples
+    """
+    widths = [len(header) for header, _ in columns]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+
+    lines = [f"[bold]{title}[/bold]", ""]
+    lines.append("  ".join(
+        f"[bold]{header:<{widths[i]}}[/bold]"
+        for i, (header, _) in enumerate(columns)
+    ))
+    for row in rows:
+        lines.append("  ".join(
+            f"[{columns[i][1]}]{cell:<{widths[i]}}[/{columns[i][1]}]"
+            for i, cell in enumerate(row)
+        ))
+    console.print("\n".join(lines))
+
+
+_PANEL_TMPL = (
+    "[bold]Project:[/bold] {project_id}\n"
+    "[bold]Last Updated:[/bold] {timestamp}\n\n"
+    "[cyan]Resources:[/cyan]\n"
+    "  • Compute Instances: {vms}\n"
+    "  • Networks: {nets}\n"
+    "  • Firewall Rules: {fws}\n"
+    "  • Load Balancers: {lbs}"
+)
+
+# One row per inventory section: knowledge key, progress label, fetcher.
+# analyze_infrastructure is driven entirely by this table, so adding a
+# section (or specializing one fetcher) stays a one-place change.
+_SECTIONS = (
+    ("compute_instances", "compute instances", _fetch_instances),
+    ("networks", "networks", _fetch_networks),
+    ("firewall_rules", "firewall rules", _fetch_firewall_rules),
+    ("load_balancers", "load balancers", _fetch_load_balancers),
+)
 
 
 def analyze_infrastructure(project_id: str, silent: bool = False) -> Optional[Dict[str, Any]]:
     """
     Analyze GCP infrastructure and store knowledge.
-    
+
+    The four inventory fetches are independent gcloud calls, so they run
+    concurrently and the wall time is roughly the slowest call instead
+    of the sum.
+
     Args:
         project_id: GCP project ID
         silent: If True, don't print progress messages
-    
+
     Returns:
         Dict with infrastructure knowledge or None if failed
     """
     if not silent:
         console.print(f"\n[cyan]🔍 Analyzing infrastructure for project: {project_id}[/cyan]\n")
-    
+        console.print("[dim]Fetching compute instances, networks, firewall rules and load balancers...[/dim]")
+
     knowledge = {
         "project_id": project_id,
-        "timestamp": datetime.now().isoformat(),
-        "compute_instances": [],
-        "networks": [],
-        "firewall_rules": [],
-        "load_balancers": []
+        "timestamp": datetime.now(timezone.utc),
     }
-    
-    
-    if not silent:
-        console.print("[dim]Fetching compute instances...[/dim]")
-    
-    output = run_gcloud_command(
-        ["compute", "instances", "list", "--format=json"],
-        project_id=project_id
-    )
-    
-    if output:
-        try:
-            instances = json.loads(output)
-            for instance in instances:
-                vm_info = {
-                    "name": instance.get("name"),
-                    "zone": instance.get("zone", "").split("/")[-1],
-                    "machine_type": instance.get("machineType", "").split("/")[-1],
-                    "status": instance.get("status"),
-                    "internal_ip": None,
-                    "external_ip": None,
-                    "tags": instance.get("tags", {}).get("items", [])
-                }
-                
-                
-                for interface in instance.get("networkInterfaces", []):
-                    if interface.get("networkIP"):
-                        vm_info["internal_ip"] = interface["networkIP"]
-                    
-                    for config in interface.get("accessConfigs", []):
-                        if config.get("natIP"):
-                            vm_info["external_ip"] = config["natIP"]
-                
-                knowledge["compute_instances"].append(vm_info)
-            
-            if not silent:
-                console.print(f"[green]✓ Found {len(instances)} compute instances[/green]")
-        except json.JSONDecodeError:
-            if not silent:
-                console.print("[yellow]⚠ Could not parse compute instances[/yellow]")
-    
-    
-    if not silent:
-        console.print("[dim]Fetching networks...[/dim]")
-    
-    output = run_gcloud_command(
-        ["compute", "networks", "list", "--format=json"],
-        project_id=project_id
-    )
-    
-    if output:
-        try:
-            networks = json.loads(output)
-            for network in networks:
-                net_info = {
-                    "name": network.get("name"),
-                    "auto_create_subnetworks": network.get("autoCreateSubnetworks"),
-                    "subnets": []
-                }
-                
-                
-                subnet_output = run_gcloud_command(
-                    ["compute", "networks", "subnets", "list", 
-                     f"--network={network.get('name')}", "--format=json"],
-                    project_id=project_id
-                )
-                
-                if subnet_output:
-                    try:
-                        subnets = json.loads(subnet_output)
-                        for subnet in subnets:
-                            net_info["subnets"].append({
-                                "name": subnet.get("name"),
-                                "region": subnet.get("region", "").split("/")[-1],
-                                "ip_range": subnet.get("ipCidrRange")
-                            })
-                    except json.JSONDecodeError:
-                        pass
-                
-                knowledge["networks"].append(net_info)
-            
-            if not silent:
-                console.print(f"[green]✓ Found {len(networks)} networks[/green]")
-        except json.JSONDecodeError:
-            if not silent:
-                console.print("[yellow]⚠ Could not parse networks[/yellow]")
-    
-    
-    if not silent:
-        console.print("[dim]Fetching firewall rules...[/dim]")
-    
-    output = run_gcloud_command(
-        ["compute", "firewall-rules", "list", "--format=json"],
-        project_id=project_id
-    )
-    
-    if output:
-        try:
-            rules = json.loads(output)
-            for rule in rules:
-                rule_info = {
-                    "name": rule.get("name"),
-                    "network": rule.get("network", "").split("/")[-1],
-                    "direction": rule.get("direction"),
-                    "priority": rule.get("priority"),
-                    "action": "ALLOW" if rule.get("allowed") else "DENY",
-                    "source_ranges": rule.get("sourceRanges", []),
-                    "target_tags": rule.get("targetTags", []),
-                    "allowed": rule.get("allowed", []),
-                    "denied": rule.get("denied", [])
-                }
-                
-                knowledge["firewall_rules"].append(rule_info)
-            
-            if not silent:
-                console.print(f"[green]✓ Found {len(rules)} firewall rules[/green]")
-        except json.JSONDecodeError:
-            if not silent:
-                console.print("[yellow]⚠ Could not parse firewall rules[/yellow]")
-    
-    
-    if not silent:
-        console.print("[dim]Fetching load balancers...[/dim]")
-    
-    output = run_gcloud_command(
-        ["compute", "forwarding-rules", "list", "--format=json"],
-        project_id=project_id
-    )
-    
-    if output:
-        try:
-            lbs = json.loads(output)
-            for lb in lbs:
-                lb_info = {
-                    "name": lb.get("name"),
-                    "type": lb.get("loadBalancingScheme"),
-                    "ip_address": lb.get("IPAddress"),
-                    "region": lb.get("region", "").split("/")[-1] if lb.get("region") else "global",
-                    "target": lb.get("target", "").split("/")[-1]
-                }
-                
-                knowledge["load_balancers"].append(lb_info)
-            
+
+    with ThreadPoolExecutor(max_workers=len(_SECTIONS)) as executor:
+        futures = [
+            executor.submit(fetcher, project_id)
+            for _, _, fetcher in _SECTIONS
+        ]
+        results = [future.result() for future in futures]
+
+    for (key, label, _), items in zip(_SECTIONS, results):
+        if items is None:
+            knowledge[key] = []
             if not silent:
-                console.print(f"[green]✓ Found {len(lbs)} load balancers[/green]")
-        except json.JSONDecodeError:
+                console.print(f"[yellow]⚠ Could not parse {label}[/yellow]")
+        else:
+            knowledge[key] = items
             if not silent:
-                console.print("[yellow]⚠ Could not parse load balancers[/yellow]")
-    
-    
+                count = _instance_count(items) if key == "compute_instances" else len(items)
+                console.print(f"[green]✓ Found {count} {label}[/green]")
+
+
     knowledge_file = get_knowledge_file_path(project_id)
-    knowledge_file.write_text(json.dumps(knowledge, indent=2), encoding="utf-8")
-    
+    _write_knowledge_file(knowledge_file, knowledge)
+    _CTX_CACHE.pop(knowledge_file, None)
+    _note_knowledge_written(project_id, knowledge_file)
+
     if not silent:
         console.print(f"\n[green]✓ Infrastructure knowledge saved to {knowledge_file}[/green]\n")
-    
+
     return knowledge
 
 
@@ -239,17 +456,18 @@ def view_stored_knowledge_interactive() -> None:
         return
     
     try:
-        knowledge = json.loads(knowledge_file.read_text(encoding="utf-8"))
-        
-        
+        knowledge = _load_knowledge_lazy(knowledge_file)
+
+
         console.print(Panel(
-            f"[bold]Project:[/bold] {knowledge.get('project_id')}\n"
-            f"[bold]Last Updated:[/bold] {knowledge.get('timestamp')}\n\n"
-            f"[cyan]Resources:[/cyan]\n"
-            f"  • Compute Instances: {len(knowledge.get('compute_instances', []))}\n"
-            f"  • Networks: {len(knowledge.get('networks', []))}\n"
-            f"  • Firewall Rules: {len(knowledge.get('firewall_rules', []))}\n"
-            f"  • Load Balancers: {len(knowledge.get('load_balancers', []))}",
+            _PANEL_TMPL.format_map({
+                "project_id": knowledge.get("project_id"),
+                "timestamp": knowledge.get("timestamp"),
+                "vms": _instance_count(knowledge.get("compute_instances", [])),
+                "nets": len(knowledge.get("networks", [])),
+                "fws": len(knowledge.get("firewall_rules", [])),
+                "lbs": len(knowledge.get("load_balancers", [])),
+            }),
             title="📚 Infrastructure Knowledge",
             border_style="cyan"
         ))
@@ -272,25 +490,19 @@ def view_stored_knowledge_interactive() -> None:
         action = menu_options[choice]
         
         if action == "vms":
-            table = Table(title="Compute Instances", border_style="cyan")
-            table.add_column("Name", style="cyan")
-            table.add_column("Zone", style="white")
-            table.add_column("Type", style="white")
-            table.add_column("Status", style="green")
-            table.add_column("Internal IP", style="white")
-            table.add_column("External IP", style="white")
-            
-            for vm in knowledge.get("compute_instances", []):
-                table.add_row(
-                    vm.get("name", ""),
-                    vm.get("zone", ""),
-                    vm.get("machine_type", ""),
-                    vm.get("status", ""),
-                    vm.get("internal_ip", "-"),
-                    vm.get("external_ip", "-")
-                )
-            
-            console.print(table)
+            rows = [
+                (name or "", zone or "", mtype or "", status or "",
+                 internal_ip or "-", external_ip or "-")
+                for name, zone, mtype, status, internal_ip, external_ip, _
+                in _iter_instances(knowledge.get("compute_instances", []))
+            ]
+            _print_flat_table(
+                "Compute Instances",
+                [("Name", "cyan"), ("Zone", "white"), ("Type", "white"),
+                 ("Status", "green"), ("Internal IP", "white"),
+                 ("External IP", "white")],
+                rows
+            )
             console.print()
         
         elif action == "networks":
@@ -311,23 +523,19 @@ def view_stored_knowledge_interactive() -> None:
                 console.print()
         
         elif action == "firewall":
-            table = Table(title="Firewall Rules", border_style="cyan")
-            table.add_column("Name", style="cyan")
-            table.add_column("Network", style="white")
-            table.add_column("Direction", style="white")
-            table.add_column("Action", style="green")
-            table.add_column("Priority", style="white")
-            
-            for rule in knowledge.get("firewall_rules", []):
-                table.add_row(
-                    rule.get("name", ""),
-                    rule.get("network", ""),
-                    rule.get("direction", ""),
-                    rule.get("action", ""),
-                    str(rule.get("priority", ""))
-                )
-            
-            console.print(table)
+            rows = [
+                (rule.get("name", ""), rule.get("network", ""),
+                 rule.get("direction", ""), rule.get("action", ""),
+                 str(rule.get("priority", "")))
+                for rule in knowledge.get("firewall_rules", [])
+            ]
+            _print_flat_table(
+                "Firewall Rules",
+                [("Name", "cyan"), ("Network", "white"),
+                 ("Direction", "white"), ("Action", "green"),
+                 ("Priority", "white")],
+                rows
+            )
             console.print()
         
         elif action == "lbs":
@@ -355,92 +563,124 @@ def view_stored_knowledge_interactive() -> None:
         console.print(f"[red]Error loading knowledge: {e}[/red]\n")
 
 
+# Built context strings keyed by knowledge file, invalidated via mtime,
+# so repeated AI turns in one session skip the parse+format entirely.
+_CTX_CACHE: Dict[Path, tuple] = {}
+
+_CTX_SEP = "=" * 80
+
+
 def get_infrastructure_context_for_ai(project_id: str) -> str:
-    
+
     knowledge_file = get_knowledge_file_path(project_id)
-    
-    if not knowledge_file.exists():
+
+    try:
+        mtime_ns = knowledge_file.stat().st_mtime_ns
+    except FileNotFoundError:
         return ""
-    
+
+    cached = _CTX_CACHE.get(knowledge_file)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
     try:
-        knowledge = json.loads(knowledge_file.read_text(encoding="utf-8"))
-        
-        context = "\n\n" + "="*80 + "\n"
-        context += "INFRASTRUCTURE KNOWLEDGE BASE\n"
-        context += "="*80 + "\n\n"
-        
-        context += f"Project: {project_id}\n"
-        context += f"Last Updated: {knowledge.get('timestamp', 'Unknown')}\n\n"
-        
-        
+        knowledge = _read_knowledge_file(knowledge_file)
+
+        # Accumulate into a list and join once at the end; repeated
+        # `context += ...` is quadratic in the total context length.
+        parts = [
+            f"\n\n{_CTX_SEP}\n",
+            "INFRASTRUCTURE KNOWLEDGE BASE\n",
+            f"{_CTX_SEP}\n\n",
+            f"Project: {project_id}\n",
+            f"Last Updated: {knowledge.get('timestamp', 'Unknown')}\n\n",
+        ]
+
+        # One dict lookup per section, and one per field per record; the
+        # loop bodies then run on locals only.
+        vms = knowledge.get("compute_instances") or []
+        vm_count = _instance_count(vms)
+        networks = knowledge.get("networks") or []
+        firewall_rules = knowledge.get("firewall_rules") or []
+        load_balancers = knowledge.get("load_balancers") or []
+
         resource_counts = []
-        
-        if knowledge.get("compute_instances"):
-            count = len(knowledge["compute_instances"])
-            resource_counts.append(f"{count} VMs")
-        
-        if knowledge.get("networks"):
-            count = len(knowledge["networks"])
-            resource_counts.append(f"{count} Networks")
-        
-        if knowledge.get("firewall_rules"):
-            count = len(knowledge["firewall_rules"])
-            resource_counts.append(f"{count} Firewall Rules")
-        
-        if knowledge.get("load_balancers"):
-            count = len(knowledge["load_balancers"])
-            resource_counts.append(f"{count} Load Balancers")
-        
+
+        if vm_count:
+            resource_counts.append(f"{vm_count} VMs")
+
+        if networks:
+            resource_counts.append(f"{len(networks)} Networks")
+
+        if firewall_rules:
+            resource_counts.append(f"{len(firewall_rules)} Firewall Rules")
+
+        if load_balancers:
+            resource_counts.append(f"{len(load_balancers)} Load Balancers")
+
         if resource_counts:
-            context += f"Resources: {', '.join(resource_counts)}\n\n"
-        
-        
-        if knowledge.get("compute_instances"):
-            context += "COMPUTE INSTANCES:\n"
-            for vm in knowledge["compute_instances"]:
-                context += f"  • {vm.get('name')} ({vm.get('zone')})\n"
-                context += f"    Status: {vm.get('status')}\n"
-                context += f"    Machine Type: {vm.get('machine_type')}\n"
-                if vm.get('internal_ip'):
-                    context += f"    Internal IP: {vm.get('internal_ip')}\n"
-                if vm.get('external_ip'):
-                    context += f"    External IP: {vm.get('external_ip')}\n"
-                if vm.get('tags'):
-                    context += f"    Tags: {', '.join(vm.get('tags', []))}\n"
-                context += "\n"
-        
-        if knowledge.get("networks"):
-            context += "NETWORKS:\n"
-            for net in knowledge["networks"]:
-                context += f"  • {net.get('name')}\n"
-                if net.get('subnets'):
-                    context += f"    Subnets: {len(net.get('subnets', []))}\n"
-                context += "\n"
-        
-        if knowledge.get("firewall_rules"):
-            context += "FIREWALL RULES:\n"
-            for rule in knowledge["firewall_rules"]:
-                context += f"  • {rule.get('name')}\n"
-                context += f"    Direction: {rule.get('direction')}\n"
-                context += f"    Action: {rule.get('action')}\n"
-                if rule.get('source_ranges'):
-                    context += f"    Sources: {', '.join(rule.get('source_ranges', []))}\n"
-                if rule.get('allowed'):
-                    protocols = [f"{a.get('protocol', 'all')}" for a in rule.get('allowed', [])]
-                    context += f"    Allowed: {', '.join(protocols)}\n"
-                context += "\n"
-        
-        if knowledge.get("load_balancers"):
-            context += "LOAD BALANCERS:\n"
-            for lb in knowledge["load_balancers"]:
-                context += f"  • {lb.get('name')}\n"
-                context += f"    Type: {lb.get('type')}\n"
-                if lb.get('ip_address'):
-                    context += f"    IP: {lb.get('ip_address')}\n"
-                context += "\n"
-        
-        context += "="*80 + "\n"
-        
+            parts.append(f"Resources: {', '.join(resource_counts)}\n\n")
+
+
+        if vm_count:
+            parts.append("COMPUTE INSTANCES:\n")
+            for name, zone, machine_type, status, internal_ip, external_ip, tags in \
+                    _iter_instances(vms):
+                parts.append(
+                    f"  • {name} ({zone})\n"
+                    f"    Status: {status}\n"
+                    f"    Machine Type: {machine_type}\n"
+                )
+                if internal_ip:
+                    parts.append(f"    Internal IP: {internal_ip}\n")
+                if external_ip:
+                    parts.append(f"    External IP: {external_ip}\n")
+                if tags:
+                    parts.append(f"    Tags: {', '.join(tags)}\n")
+                parts.append("\n")
+
+        if networks:
+            parts.append("NETWORKS:\n")
+            for net in networks:
+                subnets = net.get('subnets')
+                parts.append(f"  • {net.get('name')}\n")
+                if subnets:
+                    parts.append(f"    Subnets: {len(subnets)}\n")
+                parts.append("\n")
+
+        if firewall_rules:
+            parts.append("FIREWALL RULES:\n")
+            for rule in firewall_rules:
+                source_ranges = rule.get('source_ranges')
+                allowed = rule.get('allowed')
+                parts.append(
+                    f"  • {rule.get('name')}\n"
+                    f"    Direction: {rule.get('direction')}\n"
+                    f"    Action: {rule.get('action')}\n"
+                )
+                if source_ranges:
+                    parts.append(f"    Sources: {', '.join(source_ranges)}\n")
+                if allowed:
+                    protocols = [f"{a.get('protocol', 'all')}" for a in allowed]
+                    parts.append(f"    Allowed: {', '.join(protocols)}\n")
+                parts.append("\n")
+
+        if load_balancers:
+            parts.append("LOAD BALANCERS:\n")
+            for lb in load_balancers:
+                ip_address = lb.get('ip_address')
+                parts.append(
+                    f"  • {lb.get('name')}\n"
+                    f"    Type: {lb.get('type')}\n"
+                )
+                if ip_address:
+                    parts.append(f"    IP: {ip_address}\n")
+                parts.append("\n")
+
+        parts.append(f"{_CTX_SEP}\n")
+
+        context = "".join(parts)
+        _CTX_CACHE[knowledge_file] = (mtime_ns, context)
         return context
         
     except Exception as e:
@@ -448,12 +688,69 @@ def get_infrastructure_context_for_ai(project_id: str) -> str:
         return ""
 
 
-def auto_refresh_knowledge(project_id: str) -> None:
+def _refresh_single_instance(project_id: str, name: str) -> bool:
+    """Patch one instance entry in the stored knowledge.
+
+    Returns False when the fast path doesn't apply (legacy layout,
+    unknown instance, or describe failure) so the caller can fall back
+    to the full scan.
+    """
+    knowledge_file = get_knowledge_file_path(project_id)
+    try:
+        knowledge = _read_knowledge_file(knowledge_file)
+    except Exception:
+        return False
+
+    ci = knowledge.get("compute_instances")
+    if isinstance(ci, list):
+        return False
+
+    try:
+        idx = ci["name"].index(name)
+    except (KeyError, ValueError):
+        return False
+
+    output = run_gcloud_command(
+        ["compute", "instances", "describe", name,
+         f"--zone={ci['zone'][idx]}", f"--format={_INSTANCE_PROJECTION}"],
+        project_id=project_id
+    )
+    if not output or not output.strip():
+        return False
+
+    name_v, zone, machine_type, status, internal_ip, external_ip, tags = \
+        output.strip().splitlines()[0].split("\t")
+    ci["name"][idx] = name_v
+    ci["zone"][idx] = zone
+    ci["machine_type"][idx] = machine_type
+    ci["status"][idx] = status
+    ci["internal_ip"][idx] = internal_ip or None
+    ci["external_ip"][idx] = external_ip or None
+    ci["tags"][idx] = tags.split("|") if tags else []
+
+    knowledge["timestamp"] = datetime.now(timezone.utc)
+    _write_knowledge_file(knowledge_file, knowledge)
+    _CTX_CACHE.pop(knowledge_file, None)
+    _note_knowledge_written(project_id, knowledge_file)
+    return True
+
+
+def auto_refresh_knowledge(project_id: str, changed: Optional[tuple] = None) -> None:
     """
     Automatically refresh infrastructure knowledge after changes.
     This is called after infrastructure modifications.
+
+    Args:
+        project_id: GCP project ID
+        changed: Optional ("instance", name) hint naming the modified
+            resource; patches that one entry with a single describe call
+            instead of re-fetching all four inventories
     """
     console.print("\n[dim]📚 Updating infrastructure knowledge...[/dim]")
+    if changed is not None and changed[0] == "instance" \
+            and _refresh_single_instance(project_id, changed[1]):
+        console.print("[dim]✓ Knowledge updated[/dim]\n")
+        return
     analyze_infrastructure(project_id, silent=True)
     console.print("[dim]✓ Knowledge updated[/dim]\n")
 
@@ -472,19 +769,27 @@ def update_knowledge_for_ai(project_id: str) -> Dict[str, Any]:
     
     if knowledge:
         console.print("[dim]✓ Knowledge updated[/dim]\n")
-        
+
+        vm_count = _instance_count(knowledge.get("compute_instances", []))
+
+        # The in-memory knowledge holds a datetime; the tool result goes
+        # through plain json.dumps, so hand it back as a string.
+        timestamp = knowledge.get("timestamp")
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.isoformat()
+
         # Return summary for AI
         return {
             "success": True,
             "project_id": project_id,
-            "timestamp": knowledge.get("timestamp"),
+            "timestamp": timestamp,
             "summary": {
-                "compute_instances": len(knowledge.get("compute_instances", [])),
+                "compute_instances": vm_count,
                 "networks": len(knowledge.get("networks", [])),
                 "firewall_rules": len(knowledge.get("firewall_rules", [])),
                 "load_balancers": len(knowledge.get("load_balancers", []))
             },
-            "message": f"Infrastructure knowledge updated successfully. Found {len(knowledge.get('compute_instances', []))} VMs, {len(knowledge.get('networks', []))} networks, {len(knowledge.get('firewall_rules', []))} firewall rules, and {len(knowledge.get('load_balancers', []))} load balancers."
+            "message": f"Infrastructure knowledge updated successfully. Found {vm_count} VMs, {len(knowledge.get('networks', []))} networks, {len(knowledge.get('firewall_rules', []))} firewall rules, and {len(knowledge.get('load_balancers', []))} load balancers."
         }
     else:
         console.print("[yellow]⚠ Failed to update knowledge[/yellow]\n")
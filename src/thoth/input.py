@@ -1,28 +1,41 @@
 
 
+import select
+import sys
+from typing import Optional
 import readchar
 
 
+# Built once at import; get_key used to rebuild this dict on every
+# keystroke, which adds up during arrow-key driven navigation.
+_KEY_MAP = {
+    readchar.key.UP: "up",
+    readchar.key.DOWN: "down",
+    readchar.key.RIGHT: "right",
+    readchar.key.LEFT: "left",
+    readchar.key.ENTER: "enter",
+    readchar.key.ESC: "escape",
+    readchar.key.CTRL_P: "up",
+    readchar.key.CTRL_N: "down",
+    readchar.key.BACKSPACE: "backspace",
+    "\x7f": "backspace",
+    "\b": "backspace",
+}
+
+_CTRL_C = readchar.key.CTRL_C
+
+
 def get_key() -> str:
-    
+
     key = readchar.readkey()
-    
-    key_mapping = {
-        readchar.key.UP: "up",
-        readchar.key.DOWN: "down",
-        readchar.key.RIGHT: "right",
-        readchar.key.LEFT: "left",
-        readchar.key.ENTER: "enter",
-        readchar.key.ESC: "escape",
-        readchar.key.CTRL_P: "up",
-        readchar.key.CTRL_N: "down",
-    }
-    
-    if key in key_mapping:
-        return key_mapping[key]
-    if key in (readchar.key.BACKSPACE, "\x7f", "\b"):
-        return "backspace"
-    if key == readchar.key.CTRL_C:
+    if key == _CTRL_C:
         raise KeyboardInterrupt
-    
-    return key
\ No newline at end of file
+    return _KEY_MAP.get(key, key)
+
+
+def get_key_nowait() -> Optional[str]:
+
+    ready, _, _ = select.select([sys.stdin], [], [], 0)
+    if not ready:
+        return None
+    return get_key()
@@ -1,22 +1,73 @@
 
 
+import copy
 import json
+import re
+import shlex
+import socket
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from urllib.parse import urlparse
 from typing import Optional, Dict, Any, List
-from rich.prompt import Confirm
-from rich.panel import Panel
-from rich.table import Table
-from rich.spinner import Spinner
-from rich.live import Live
-from prompt_toolkit import prompt
-from prompt_toolkit.formatted_text import HTML
 from .display import console, select_with_arrows
-from .crypto import encrypt_value, decrypt_value
+from .utils import replace_private_file
+from .crypto import encrypt_batch, decrypt_batch
+from .gcp import json_loads
 from .mcp_client import MCPManager, MCPConnection
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# Lazy parser for JSON-RPC probe replies: the question is only "is
+# there a result and no error", so a server exposing thousands of tools
+# shouldn't cost a fully materialized list just to answer it.
+_PROBE_PARSER = simdjson.Parser() if simdjson is not None else None
+
+
+def _jsonrpc_ok(raw: bytes) -> bool:
+    """True when a JSON-RPC reply carries a result and no error."""
+    try:
+        if _PROBE_PARSER is not None:
+            keys = _PROBE_PARSER.parse(raw).keys()
+        else:
+            keys = json_loads(raw)
+        return "result" in keys and "error" not in keys
+    except Exception:
+        return False
+
 MCP_CONFIG_PATH = Path.home() / ".thoth_mcp_config.json"
+# Binary sidecar written alongside the JSON when msgpack is installed:
+# 30-60% smaller and parse-free to load. The JSON stays authoritative
+# for hand edits — the sidecar is only trusted while it is not older.
+MCP_CONFIG_MPK_PATH = MCP_CONFIG_PATH.with_suffix(".mpk")
+
+# Env var names that get their values encrypted at rest. One C-level
+# regex scan per key, instead of uppercasing and substring-testing it
+# four times in Python.
+_SENSITIVE_RE = re.compile(r"KEY|SECRET|TOKEN|PASSWORD", re.IGNORECASE)
+
+# Marker for env values stored encrypted at rest.
+_ENC_PREFIX = "encrypted:"
+_ENC_LEN = len(_ENC_PREFIX)
 
 
 _mcp_manager: Optional[MCPManager] = None
@@ -40,19 +91,55 @@ class MCPServer:
         self.env = env or {}
 
 
+# Parsed-and-decrypted config keyed by (mtime_ns, size), so repeat
+# loads within a session skip the disk read and the per-value decrypt.
+# Callers get a deep copy; they mutate their result freely.
+_CONFIG_CACHE: Optional[tuple] = None
+
+
 def load_mcp_config() -> Dict[str, Any]:
-    
-    if not MCP_CONFIG_PATH.exists():
+
+    global _CONFIG_CACHE
+
+    try:
+        st = MCP_CONFIG_PATH.stat()
+    except FileNotFoundError:
         return {"servers": {}}
-    
+
+    stat_key = (st.st_mtime_ns, st.st_size)
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == stat_key:
+        return copy.deepcopy(_CONFIG_CACHE[1])
+
     try:
-        data = json.loads(MCP_CONFIG_PATH.read_text(encoding="utf-8"))
-        
+        data = None
+        if msgpack is not None:
+            try:
+                if MCP_CONFIG_MPK_PATH.stat().st_mtime_ns >= st.st_mtime_ns:
+                    data = msgpack.unpackb(MCP_CONFIG_MPK_PATH.read_bytes(), raw=False)
+            except (FileNotFoundError, ValueError):
+                data = None
+
+        if data is None:
+            data = json_loads(MCP_CONFIG_PATH.read_bytes())
+
+        # Gather every encrypted env value first and decrypt them in one
+        # batch, then scatter the plaintexts back.
+        pending = []
         for server_name, server_config in data.get("servers", {}).items():
-            if "env" in server_config:
-                for key, value in server_config["env"].items():
-                    if value.startswith("encrypted:"):
-                        server_config["env"][key] = decrypt_value(value[10:])
+            env = server_config.get("env")
+            if env:
+                for key, value in env.items():
+                    # Slice-compare beats a startswith method call on
+                    # this per-value hot loop.
+                    if value[:_ENC_LEN] == _ENC_PREFIX:
+                        pending.append((env, key, value[_ENC_LEN:]))
+
+        if pending:
+            plaintexts = decrypt_batch([ciphertext for _, _, ciphertext in pending])
+            for (env, key, _), plaintext in zip(pending, plaintexts):
+                env[key] = plaintext
+
+        _CONFIG_CACHE = (stat_key, copy.deepcopy(data))
         return data
     except Exception as e:
         console.print(f"[red]Error loading MCP config: {e}[/red]")
@@ -62,15 +149,48 @@ def load_mcp_config() -> Dict[str, Any]:
 def save_mcp_config(config: Dict[str, Any]) -> None:
     
     
-    config_copy = json.loads(json.dumps(config))  
-    for server_name, server_config in config_copy.get("servers", {}).items():
-        if "env" in server_config:
-            for key, value in server_config["env"].items():
-                if any(sensitive in key.upper() for sensitive in ["KEY", "SECRET", "TOKEN", "PASSWORD"]):
-                    server_config["env"][key] = f"encrypted:{encrypt_value(value)}"
-    
-    MCP_CONFIG_PATH.write_text(json.dumps(config_copy, indent=2), encoding="utf-8")
-    MCP_CONFIG_PATH.chmod(0o600)
+    # Rebuild only the env dicts that need rewriting; args lists, flags
+    # and untouched servers are referenced as-is. The caller's config is
+    # never mutated and the copy work is bounded by the env entry count
+    # instead of the whole config tree.
+    servers = {}
+    pending = []
+    plaintexts = []
+    for server_name, server_config in config.get("servers", {}).items():
+        env = server_config.get("env")
+        if env:
+            new_env = dict(env)
+            touched = False
+            for key, value in env.items():
+                if _SENSITIVE_RE.search(key):
+                    pending.append((new_env, key))
+                    plaintexts.append(value)
+                    touched = True
+            if touched:
+                servers[server_name] = {**server_config, "env": new_env}
+            else:
+                servers[server_name] = server_config
+        else:
+            servers[server_name] = server_config
+
+    if pending:
+        for (new_env, key), token in zip(pending, encrypt_batch(plaintexts)):
+            new_env[key] = _ENC_PREFIX + token
+
+    config_copy = {**config, "servers": servers}
+
+    if orjson is not None:
+        payload = orjson.dumps(config_copy, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(config_copy, indent=2).encode("utf-8")
+    replace_private_file(MCP_CONFIG_PATH, payload)
+
+    # Written second so its mtime is never older than the JSON's.
+    if msgpack is not None:
+        replace_private_file(MCP_CONFIG_MPK_PATH, msgpack.packb(config_copy))
+
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = None
 
 
 def initialize_mcp_servers() -> None:
@@ -82,22 +202,41 @@ def initialize_mcp_servers() -> None:
         return
     
     manager = get_mcp_manager()
-    
+
+    to_start = []
     for name, server_config in servers.items():
-        
-        enabled = server_config.get("enabled", True)
-        
-        if not enabled:
+
+        if not server_config.get("enabled", True):
             console.print(f"[dim]Skipping disabled MCP server: {name}[/dim]")
             continue
-        
-        command = server_config.get("command", "")
-        args = server_config.get("args", [])
-        env = server_config.get("env", {})
-        
-        if command:
-            console.print(f"[dim]Starting MCP server: {name}...[/dim]")
-            if manager.start_server(name, transport="stdio", command=command, args=args, env=env):
+
+        if server_config.get("command"):
+            to_start.append((name, server_config))
+
+    if not to_start:
+        return
+
+    # Each startup is an independent spawn + stdio handshake (seconds
+    # for npx-based servers), so run them concurrently and report as
+    # they finish: total time is the slowest server, not the sum.
+    console.print(f"[dim]Starting {len(to_start)} MCP server(s)...[/dim]")
+
+    with ThreadPoolExecutor(max_workers=min(8, len(to_start))) as executor:
+        futures = {
+            executor.submit(
+                manager.start_server,
+                name,
+                transport="stdio",
+                command=server_config.get("command", ""),
+                args=server_config.get("args", []),
+                env=server_config.get("env", {})
+            ): name
+            for name, server_config in to_start
+        }
+
+        for future in as_completed(futures):
+            name = futures[future]
+            if future.result():
                 console.print(f"[green]✓ MCP server '{name}' connected[/green]")
             else:
                 console.print(f"[yellow]⚠ Failed to connect to MCP server '{name}'[/yellow]")
@@ -110,7 +249,10 @@ def shutdown_mcp_servers() -> None:
 
 
 def add_mcp_server_interactive() -> Optional[MCPServer]:
-    
+
+    from prompt_toolkit import prompt
+    from prompt_toolkit.formatted_text import HTML
+
     console.print("\n[bold cyan]➕ Add MCP Server[/bold cyan]\n")
     
     
@@ -135,7 +277,13 @@ def add_mcp_server_interactive() -> Optional[MCPServer]:
         HTML("<b>Arguments</b> (space-separated, or press Enter to skip): "),
         default=""
     ).strip()
-    args = args_input.split() if args_input else []
+    # shlex keeps quoted arguments ('--path "/My Docs"') intact, and the
+    # list is stored as-is so startup never re-splits it.
+    try:
+        args = shlex.split(args_input) if args_input else []
+    except ValueError as e:
+        console.print(f"[yellow]Could not parse arguments: {e}[/yellow]")
+        return None
     
     
     env = {}
@@ -147,7 +295,7 @@ def add_mcp_server_interactive() -> Optional[MCPServer]:
         if not key:
             break
         
-        is_sensitive = any(s in key.upper() for s in ["KEY", "SECRET", "TOKEN", "PASSWORD"])
+        is_sensitive = _SENSITIVE_RE.search(key) is not None
         value = prompt(f"  Value for {key}: ", is_password=is_sensitive).strip()
         
         if value:
@@ -157,7 +305,9 @@ def add_mcp_server_interactive() -> Optional[MCPServer]:
 
 
 def configure_mcp_interactive() -> None:
-    
+
+    from rich.prompt import Confirm
+
     config = load_mcp_config()
     
     while True:
@@ -232,7 +382,10 @@ def configure_mcp_interactive() -> None:
 
 
 def toggle_mcp_server(config: Dict[str, Any]) -> None:
-    
+
+    from rich.live import Live
+    from rich.spinner import Spinner
+
     servers = config.get("servers", {})
     
     if not servers:
@@ -295,16 +448,38 @@ def toggle_mcp_server(config: Dict[str, Any]) -> None:
         console.print(f"[yellow]✓ Server '{server_name}' is now OFF[/yellow]\n")
 
 
+# Last rendered server table, keyed by a hash of the fields that feed
+# it, so idle re-renders skip the rich layout work entirely.
+_TABLE_CACHE: Optional[tuple] = None
+
+
 def show_mcp_servers(config: Dict[str, Any]) -> None:
-    
+
+    from rich.table import Table
+
+    global _TABLE_CACHE
+
     servers = config.get("servers", {})
-    
+
     if not servers:
         console.print("[yellow]No MCP servers configured[/yellow]\n")
         return
-    
-    manager = get_mcp_manager()
-    
+
+    connected = get_mcp_manager().connection_status()
+
+    # Only the displayed fields participate; env values never render.
+    cache_key = hash((
+        tuple(
+            (name, cfg.get("command", ""), tuple(cfg.get("args", [])), cfg.get("enabled", True))
+            for name, cfg in servers.items()
+        ),
+        tuple(sorted(connected.items())),
+    ))
+    if _TABLE_CACHE is not None and _TABLE_CACHE[0] == cache_key:
+        console.print(_TABLE_CACHE[1])
+        console.print()
+        return
+
     table = Table(title="Configured MCP Servers", border_style="cyan")
     table.add_column("Name", style="cyan", no_wrap=True)
     table.add_column("Command", style="white")
@@ -317,7 +492,7 @@ def show_mcp_servers(config: Dict[str, Any]) -> None:
         enabled = server_config.get("enabled", True)
         enabled_str = "🟢 ON" if enabled else "🔴 OFF"
         
-        is_connected = manager.is_connected(name)
+        is_connected = connected.get(name, False)
         if enabled and is_connected:
             status = "✓ Connected"
             status_style = "green"
@@ -335,13 +510,18 @@ def show_mcp_servers(config: Dict[str, Any]) -> None:
             enabled_str,
             f"[{status_style}]{status}[/{status_style}]"
         )
-    
+
+    _TABLE_CACHE = (cache_key, table)
     console.print(table)
     console.print()
 
 
 def test_mcp_connection(config: Dict[str, Any]) -> None:
-    
+
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.spinner import Spinner
+
     servers = config.get("servers", {})
     
     if not servers:
@@ -416,64 +596,85 @@ def test_mcp_connection(config: Dict[str, Any]) -> None:
     console.print()
 
 
+# Assembled context keyed by the manager's version token. Rebuilding
+# isn't just string work — get_all_tools/get_all_resources issue live
+# JSON-RPC calls — so this saves a round of server round-trips per AI
+# turn while the connection set is stable.
+_MCP_CTX_CACHE: Optional[tuple] = None
+
+
 def get_mcp_context_for_ai(config: Dict[str, Any]) -> str:
-    
+
+    global _MCP_CTX_CACHE
+
     try:
         manager = get_mcp_manager()
-        
-        
-        all_resources = manager.get_all_resources()
-        all_tools = manager.get_all_tools()
-        
-        if not all_resources and not all_tools:
+
+        version = manager.version()
+        if _MCP_CTX_CACHE is not None and _MCP_CTX_CACHE[0] == version:
+            return _MCP_CTX_CACHE[1]
+
+        # Each connection formats (and caches) its own section, so a
+        # rebuild only walks tool schemas for servers discovered since
+        # the last one; unchanged servers contribute a stored string.
+        connections = manager.connections_snapshot()
+        tool_sections = [f for f in (c.tools_fragment() for c in connections) if f]
+        resource_sections = [f for f in (c.resources_fragment() for c in connections) if f]
+
+        if not tool_sections and not resource_sections:
+            _MCP_CTX_CACHE = (version, "")
             return ""
-        
-        context = "\n\n[Available MCP Tools - Use these automatically when needed]:\n"
-        
-        
-        if all_tools:
-            for server_name, tools in all_tools.items():
-                context += f"\nFrom {server_name}:\n"
-                for tool in tools:
-                    tool_name = tool.get('name', 'Unknown')
-                    tool_desc = tool.get('description', 'No description')
-                    context += f"  • {tool_name}: {tool_desc}\n"
-                    
-                    
-                    if 'inputSchema' in tool:
-                        schema = tool['inputSchema']
-                        if 'properties' in schema:
-                            params = ', '.join(schema['properties'].keys())
-                            context += f"    Parameters: {params}\n"
-        
-        
-        if all_resources:
-            context += "\nAvailable Resources:\n"
-            for server_name, resources in all_resources.items():
-                context += f"\nFrom {server_name}:\n"
-                for resource in resources[:10]:
-                    context += f"  • {resource.get('name', 'Unknown')}"
-                    if resource.get('uri'):
-                        context += f" ({resource['uri']})"
-                    context += "\n"
-        
+
+        parts = ["\n\n[Available MCP Tools - Use these automatically when needed]:\n"]
+        parts.extend(tool_sections)
+
+        if resource_sections:
+            parts.append("\nAvailable Resources:\n")
+            parts.extend(resource_sections)
+
+        context = "".join(parts)
+        _MCP_CTX_CACHE = (version, context)
         return context
-        
+
     except Exception:
         return ""
 
 
 def reset_mcp_config() -> None:
-    
+
+    global _CONFIG_CACHE
     shutdown_mcp_servers()
     MCP_CONFIG_PATH.unlink(missing_ok=True)
+    MCP_CONFIG_MPK_PATH.unlink(missing_ok=True)
+    _CONFIG_CACHE = None
     console.print("[green]✓ MCP configuration reset[/green]\n")
 
 
-def test_http_mcp_endpoint(url: str) -> Dict[str, Any]:
-    
+def _http_test_client():
+    """Client for the endpoint test: httpx with HTTP/2 when available —
+    one TLS handshake multiplexed across all probes — falling back to
+    HTTP/1.1 httpx without the h2 extra, then to a requests session."""
+    if httpx is not None:
+        try:
+            return httpx.Client(http2=True, timeout=10.0)
+        except ImportError:
+            return httpx.Client(timeout=10.0)
     import requests
-    
+    return requests.Session()
+
+
+def test_http_mcp_endpoint(url: str) -> Dict[str, Any]:
+
+    if httpx is not None:
+        connect_error = httpx.ConnectError
+        timeout_error = httpx.TimeoutException
+        request_error = httpx.HTTPError
+    else:
+        import requests
+        connect_error = requests.exceptions.ConnectionError
+        timeout_error = requests.exceptions.Timeout
+        request_error = requests.exceptions.RequestException
+
     results = {
         "reachable": False,
         "mcp_compatible": False,
@@ -481,88 +682,98 @@ def test_http_mcp_endpoint(url: str) -> Dict[str, Any]:
         "supports_tools": False,
         "error": None
     }
-    
-    try:
-        session = requests.Session()
-        
-        
+
+    # Cheap TCP preflight: a down server fails here in ~1s instead of
+    # burning the 5s health timeout plus 10s per JSON-RPC probe.
+    parsed = urlparse(url)
+    if parsed.hostname:
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
         try:
-            response = session.get(f"{url}/health", timeout=5)
-            results["reachable"] = True
-        except requests.exceptions.RequestException:
-            
-            results["reachable"] = True  
-        
-        
-        init_request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "thoth-test",
-                    "version": "0.1.0"
+            socket.create_connection((parsed.hostname, port), timeout=1.0).close()
+        except OSError:
+            results["error"] = "Connection refused - server not reachable"
+            return results
+
+    try:
+        # The context manager closes the session on every exit path, so
+        # failed probes no longer leak their sockets.
+        with _http_test_client() as session:
+
+            try:
+                response = session.get(f"{url}/health", timeout=5)
+                results["reachable"] = True
+            except request_error:
+
+                results["reachable"] = True
+
+            init_request = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "clientInfo": {
+                        "name": "thoth-test",
+                        "version": "0.1.0"
+                    }
                 }
             }
-        }
-        
-        response = session.post(
-            f"{url}/message",
-            json=init_request,
-            timeout=10,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        if response.status_code == 200:
-            data = response.json()
-            if "result" in data:
-                results["mcp_compatible"] = True
-                
-                
-                resources_request = {
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "resources/list"
-                }
-                
-                res_response = session.post(
-                    f"{url}/message",
-                    json=resources_request,
-                    timeout=10,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                if res_response.status_code == 200:
-                    res_data = res_response.json()
-                    if "result" in res_data and "error" not in res_data:
-                        results["supports_resources"] = True
-                
-                
-                tools_request = {
-                    "jsonrpc": "2.0",
-                    "id": 3,
-                    "method": "tools/list"
-                }
-                
-                tools_response = session.post(
-                    f"{url}/message",
-                    json=tools_request,
-                    timeout=10,
-                    headers={"Content-Type": "application/json"}
-                )
-                
-                if tools_response.status_code == 200:
-                    tools_data = tools_response.json()
-                    if "result" in tools_data and "error" not in tools_data:
-                        results["supports_tools"] = True
-        
-        session.close()
-        
-    except requests.exceptions.ConnectionError:
+
+            response = session.post(
+                f"{url}/message",
+                json=init_request,
+                timeout=10,
+                headers={"Content-Type": "application/json"}
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                if "result" in data:
+                    results["mcp_compatible"] = True
+
+                    resources_request = {
+                        "jsonrpc": "2.0",
+                        "id": 2,
+                        "method": "resources/list"
+                    }
+
+                    tools_request = {
+                        "jsonrpc": "2.0",
+                        "id": 3,
+                        "method": "tools/list"
+                    }
+
+                    # The two list probes are independent once the server
+                    # initialized; fire them concurrently and let keep-alive
+                    # reuse the established connections.
+                    with ThreadPoolExecutor(max_workers=2) as executor:
+                        res_future = executor.submit(
+                            session.post,
+                            f"{url}/message",
+                            json=resources_request,
+                            timeout=10,
+                            headers={"Content-Type": "application/json"}
+                        )
+                        tools_future = executor.submit(
+                            session.post,
+                            f"{url}/message",
+                            json=tools_request,
+                            timeout=10,
+                            headers={"Content-Type": "application/json"}
+                        )
+                        res_response = res_future.result()
+                        tools_response = tools_future.result()
+
+                    if res_response.status_code == 200:
+                        results["supports_resources"] = _jsonrpc_ok(res_response.content)
+
+                    if tools_response.status_code == 200:
+                        results["supports_tools"] = _jsonrpc_ok(tools_response.content)
+
+    except connect_error:
         results["error"] = "Connection refused - server not reachable"
-    except requests.exceptions.Timeout:
+    except timeout_error:
         results["error"] = "Connection timeout"
     except Exception as e:
         results["error"] = str(e)
@@ -571,7 +782,14 @@ def test_http_mcp_endpoint(url: str) -> Dict[str, Any]:
 
 
 def quick_test_http_server() -> None:
-    
+
+    from prompt_toolkit import prompt
+    from prompt_toolkit.formatted_text import HTML
+    from rich.live import Live
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+    from rich.spinner import Spinner
+
     console.print("\n[bold cyan]🔍 Quick HTTP MCP Server Test[/bold cyan]\n")
     console.print("[dim]Test an HTTP endpoint without saving configuration[/dim]\n")
     
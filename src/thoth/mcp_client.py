@@ -1,15 +1,60 @@
 
 
 import json
+import itertools
+import socket
 import subprocess
-import select
 import os
 import time
 import requests
-from typing import Dict, Any, List, Optional, Literal
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Literal
 from threading import Thread, Lock
 from .display import console
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+_JSONRPC_V = "2.0"
+
+# TCP keepalive so a silently dead HTTP server is noticed by the kernel
+# instead of each RPC waiting out its full timeout.
+_KEEPALIVE_OPTS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    _KEEPALIVE_OPTS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+
+
+class _KeepaliveAdapter(HTTPAdapter):
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = _KEEPALIVE_OPTS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _rpc_dumps(obj: Any) -> bytes:
+    """Serialize a JSON-RPC frame to bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _rpc_loads(data: Any) -> Any:
+
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class MCPConnection:
     
@@ -33,8 +78,27 @@ class MCPConnection:
         self.session = None  
         self.initialized = False
         self.capabilities = {}
-        self.request_id = 0
+        # itertools.count increments atomically under the GIL, so id
+        # allocation needs no lock even with the reader thread running.
+        self._id_gen = itertools.count(1).__next__
         self.lock = Lock()
+        # In-flight stdio requests keyed by JSON-RPC id; the reader
+        # thread resolves each Future as its response arrives, so
+        # several RPCs can be pipelined on one connection.
+        self._pending: Dict[Any, Future] = {}
+        self._reader: Optional[Thread] = None
+        # Cached child liveness; the reader thread flips it at EOF so
+        # the send paths skip a waitpid syscall per RPC.
+        self._alive = False
+        # httpx takes raw request bodies as content=, requests as data=.
+        self._post_body_kw = "data"
+        # Discovery results and the pre-formatted AI-context sections
+        # built from them, cached so repeated get_all_tools/context
+        # rebuilds don't re-issue list RPCs or re-walk tool schemas.
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._resources_cache: Optional[List[Dict[str, Any]]] = None
+        self._tools_fragment: Optional[str] = None
+        self._resources_fragment: Optional[str] = None
     
     def start(self) -> bool:
         
@@ -51,27 +115,34 @@ class MCPConnection:
                 return False
             
             full_command = [self.command] + self.args
-            process_env = os.environ.copy()
-            process_env.update(self.env)
+            # env=None inherits the parent environment directly; the
+            # merged copy is only built when there are overrides.
+            process_env = {**os.environ, **self.env} if self.env else None
             
+            # Binary pipes with a 64 KiB buffer: frames move as raw
+            # bytes end to end, skipping the per-line encode/decode that
+            # text mode imposes. stderr goes to DEVNULL so a chatty
+            # server can't fill an unread pipe and stall its RPCs.
             self.process = subprocess.Popen(
                 full_command,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 env=process_env,
-                text=True,
-                bufsize=1
+                bufsize=65536
             )
-            
-            
-            time.sleep(2)
-            
-            
+
+            # One short scheduler slice to fail fast on a bad command;
+            # real readiness is covered by _initialize's own timeout,
+            # so a quick server no longer pays a fixed two-second wait.
+            time.sleep(0.05)
             if self.process.poll() is not None:
                 return False
-            
-            
+
+            self._alive = True
+            self._reader = Thread(target=self._reader_loop, daemon=True)
+            self._reader.start()
+
             return self._initialize()
         except Exception:
             return False
@@ -81,18 +152,52 @@ class MCPConnection:
         try:
             if not self.url:
                 return False
-            
-            self.session = requests.Session()
+
+            if httpx is not None:
+                try:
+                    # HTTP/2 multiplexes concurrent JSON-RPC calls as
+                    # streams over one TLS connection, so parallel
+                    # list/call RPCs don't queue behind each other.
+                    self.session = httpx.Client(
+                        http2=True,
+                        timeout=httpx.Timeout(10.0, connect=5.0),
+                        limits=httpx.Limits(
+                            max_keepalive_connections=8, max_connections=32
+                        ),
+                    )
+                except ImportError:
+                    # http2 extra (h2) not installed; plain httpx still
+                    # pools and keeps connections alive.
+                    self.session = httpx.Client(
+                        timeout=httpx.Timeout(10.0, connect=5.0)
+                    )
+                self._post_body_kw = "content"
+            else:
+                self.session = requests.Session()
+                # One quick retry with a short backoff absorbs transient
+                # 5xx blips without stalling the manager's fan-out.
+                adapter = _KeepaliveAdapter(
+                    pool_connections=8,
+                    pool_maxsize=32,
+                    max_retries=Retry(
+                        total=1,
+                        backoff_factor=0.1,
+                        status_forcelist=[502, 503, 504],
+                    ),
+                )
+                self.session.mount("http://", adapter)
+                self.session.mount("https://", adapter)
+                self._post_body_kw = "data"
             
             
             try:
                 
                 response = self.session.get(f"{self.url}/health", timeout=5)
                 if response.status_code != 200:
-                    
+
                     pass
-            except requests.exceptions.RequestException:
-                
+            except Exception:
+
                 pass
             
             
@@ -108,42 +213,51 @@ class MCPConnection:
             return False
     
     def _initialize(self) -> bool:
-        
-        init_request = {
-            "jsonrpc": "2.0",
-            "id": self._next_id(),
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {},
-                "clientInfo": {
-                    "name": "thoth",
-                    "version": "0.1.0"
-                }
+
+        init_request = self._build_request("initialize", {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {
+                "name": "thoth",
+                "version": "0.1.0"
             }
+        })
+        initialized_note = {
+            "jsonrpc": _JSONRPC_V,
+            "method": "notifications/initialized"
         }
-        
-        response = self._send_request(init_request, timeout=15)
-        
-        if response and "result" in response:
-            self.capabilities = response["result"].get("capabilities", {})
-            self.initialized = True
-            
-            
-            self._send_notification({
-                "jsonrpc": "2.0",
-                "method": "notifications/initialized"
-            })
-            
-            return True
-        
-        return False
+
+        # JSON-RPC 2.0 batch: the handshake request and its follow-up
+        # notification travel in one frame, saving a round trip.
+        response = self._send_request([init_request, initialized_note], timeout=15)
+
+        if not (response and "result" in response):
+            # Batch-intolerant server: retry as the classic two-step
+            # handshake with a fresh id.
+            init_request = {**init_request, "id": self._next_id()}
+            response = self._send_request(init_request, timeout=15)
+            if not (response and "result" in response):
+                return False
+            self._send_notification(initialized_note)
+
+        self.capabilities = response["result"].get("capabilities", {})
+        self.initialized = True
+        # A (re)connect may expose a different tool set.
+        self.invalidate_tools()
+        self.invalidate_resources()
+        return True
     
     def _next_id(self) -> int:
-        
-        with self.lock:
-            self.request_id += 1
-            return self.request_id
+
+        return self._id_gen()
+
+    def _build_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """One envelope constructor for every RPC; params is omitted
+        when empty, as JSON-RPC 2.0 allows."""
+        request = {"jsonrpc": _JSONRPC_V, "id": self._next_id(), "method": method}
+        if params:
+            request["params"] = params
+        return request
     
     def _send_request(self, request: Dict[str, Any], timeout: int = 10) -> Optional[Dict[str, Any]]:
         
@@ -153,30 +267,77 @@ class MCPConnection:
             return self._send_request_http(request, timeout)
         return None
     
+    def _reader_loop(self) -> None:
+        """Single owner of the child's stdout: parses every inbound
+        frame, resolves the matching pending Future by id, and routes
+        id-less messages to the notification handler."""
+        process = self.process
+        try:
+            for line in iter(process.stdout.readline, b''):
+                try:
+                    message = _rpc_loads(line)
+                except ValueError:
+                    continue
+                if isinstance(message, list):
+                    # Batch responses arrive as an array; route each
+                    # element on its own.
+                    for item in message:
+                        self._route_message(item)
+                else:
+                    self._route_message(message)
+        except Exception:
+            pass
+
+        # EOF: the server is gone; unblock anything still waiting.
+        self._alive = False
+        with self.lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_result(None)
+
+    def _route_message(self, message: Any) -> None:
+
+        if isinstance(message, dict) and "id" in message:
+            with self.lock:
+                future = self._pending.pop(message["id"], None)
+                if future is None and message["id"] is None and len(self._pending) == 1:
+                    # An error reply to a rejected batch carries a null
+                    # id; with one request outstanding it's unambiguous.
+                    future = self._pending.popitem()[1]
+            if future is not None and not future.done():
+                future.set_result(message)
+        else:
+            self._dispatch_notification(message)
+
+    def _dispatch_notification(self, message: Any) -> None:
+
+        method = message.get("method") if isinstance(message, dict) else None
+        if method == "notifications/tools/list_changed":
+            self.invalidate_tools()
+        elif method == "notifications/resources/list_changed":
+            self.invalidate_resources()
+
     def _send_request_stdio(self, request: Dict[str, Any], timeout: int = 10) -> Optional[Dict[str, Any]]:
-        
-        if not self.process or self.process.poll() is not None:
+
+        if not self._alive:
             return None
-        
+
+        # A batch payload is keyed by its first (and only) request's id.
+        request_id = request[0].get("id") if isinstance(request, list) else request.get("id")
+        future: Future = Future()
+        with self.lock:
+            self._pending[request_id] = future
+
         try:
-            
-            request_str = json.dumps(request) + "\n"
-            self.process.stdin.write(request_str)
+            self.process.stdin.write(_rpc_dumps(request) + b"\n")
             self.process.stdin.flush()
-            
-            
-            ready, _, _ = select.select([self.process.stdout], [], [], timeout)
-            if ready:
-                response_line = self.process.stdout.readline()
-                if response_line:
-                    try:
-                        return json.loads(response_line)
-                    except json.JSONDecodeError:
-                        return None
+            return future.result(timeout=timeout)
         except Exception:
-            pass
-        
-        return None
+            with self.lock:
+                self._pending.pop(request_id, None)
+            return None
     
     def _send_request_http(self, request: Dict[str, Any], timeout: int = 10) -> Optional[Dict[str, Any]]:
         
@@ -186,13 +347,31 @@ class MCPConnection:
         try:
             response = self.session.post(
                 f"{self.url}/message",
-                json=request,
                 timeout=timeout,
-                headers={"Content-Type": "application/json"}
+                headers={"Content-Type": "application/json"},
+                **{self._post_body_kw: _rpc_dumps(request)}
             )
-            
+
             if response.status_code == 200:
-                return response.json()
+                # Parse the raw bytes ourselves instead of response.json(),
+                # so orjson handles large tool results too and no decoded
+                # text copy of the body is ever materialized. Responses
+                # are buffered whole: JSON-RPC frames must be complete
+                # before dispatch, and an incremental parser would need a
+                # dependency this project doesn't carry.
+                parsed = _rpc_loads(response.content)
+                if isinstance(parsed, list):
+                    # Batch response: pick out the reply to our request.
+                    expected = (
+                        request[0].get("id")
+                        if isinstance(request, list)
+                        else request.get("id")
+                    )
+                    for item in parsed:
+                        if isinstance(item, dict) and item.get("id") == expected:
+                            return item
+                    return None
+                return parsed
         except Exception:
             pass
         
@@ -206,13 +385,12 @@ class MCPConnection:
             self._send_notification_http(notification)
     
     def _send_notification_stdio(self, notification: Dict[str, Any]) -> None:
-        
-        if not self.process or self.process.poll() is not None:
+
+        if not self._alive:
             return
         
         try:
-            notification_str = json.dumps(notification) + "\n"
-            self.process.stdin.write(notification_str)
+            self.process.stdin.write(_rpc_dumps(notification) + b"\n")
             self.process.stdin.flush()
         except Exception:
             pass
@@ -225,29 +403,38 @@ class MCPConnection:
         try:
             self.session.post(
                 f"{self.url}/message",
-                json=notification,
                 timeout=5,
-                headers={"Content-Type": "application/json"}
+                headers={"Content-Type": "application/json"},
+                **{self._post_body_kw: _rpc_dumps(notification)}
             )
         except Exception:
             pass
     
+    def invalidate_tools(self) -> None:
+        """Drop the cached tool list (and the context fragment built
+        from it) so the next list_tools re-queries the server."""
+        self._tools_cache = None
+        self._tools_fragment = None
+
+    def invalidate_resources(self) -> None:
+
+        self._resources_cache = None
+        self._resources_fragment = None
+
     def list_resources(self) -> Optional[List[Dict[str, Any]]]:
-        
+
         if not self.initialized:
             return None
-        
-        request = {
-            "jsonrpc": "2.0",
-            "id": self._next_id(),
-            "method": "resources/list"
-        }
-        
-        response = self._send_request(request, timeout=15)
-        
+
+        if self._resources_cache is not None:
+            return self._resources_cache
+
+        response = self._send_request(self._build_request("resources/list"), timeout=15)
+
         if response and "result" in response:
-            return response["result"].get("resources", [])
-        
+            self._resources_cache = response["result"].get("resources", [])
+            return self._resources_cache
+
         return None
     
     def read_resource(self, uri: str) -> Optional[Dict[str, Any]]:
@@ -255,36 +442,27 @@ class MCPConnection:
         if not self.initialized:
             return None
         
-        request = {
-            "jsonrpc": "2.0",
-            "id": self._next_id(),
-            "method": "resources/read",
-            "params": {
-                "uri": uri
-            }
-        }
-        
+        request = self._build_request("resources/read", {"uri": uri})
+
         response = self._send_request(request, timeout=15)
         if response and "result" in response:
             return response["result"]
         return None
     
     def list_tools(self) -> Optional[List[Dict[str, Any]]]:
-        
+
         if not self.initialized:
             return None
-        
-        request = {
-            "jsonrpc": "2.0",
-            "id": self._next_id(),
-            "method": "tools/list"
-        }
-        
-        response = self._send_request(request, timeout=15)
-        
+
+        if self._tools_cache is not None:
+            return self._tools_cache
+
+        response = self._send_request(self._build_request("tools/list"), timeout=15)
+
         if response and "result" in response:
-            return response["result"].get("tools", [])
-        
+            self._tools_cache = response["result"].get("tools", [])
+            return self._tools_cache
+
         return None
     
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -292,25 +470,62 @@ class MCPConnection:
         if not self.initialized:
             return None
         
-        request = {
-            "jsonrpc": "2.0",
-            "id": self._next_id(),
-            "method": "tools/call",
-            "params": {
-                "name": tool_name,
-                "arguments": arguments
-            }
-        }
-        
+        request = self._build_request("tools/call", {
+            "name": tool_name,
+            "arguments": arguments
+        })
+
         response = self._send_request(request, timeout=30)
-        
+
         if response and "result" in response:
             return response["result"]
-        
+
         return None
-    
+
+    def tools_fragment(self) -> str:
+        """AI-context section for this server's tools, formatted once at
+        first use after discovery and reused until reconnect."""
+        if self._tools_fragment is None:
+            parts = []
+            try:
+                tools = self.list_tools() or []
+            except Exception:
+                tools = []
+            if tools:
+                parts.append(f"\nFrom {self.name}:\n")
+                for tool in tools:
+                    tool_name = tool.get('name', 'Unknown')
+                    tool_desc = tool.get('description', 'No description')
+                    parts.append(f"  • {tool_name}: {tool_desc}\n")
+
+                    schema = tool.get('inputSchema')
+                    if schema and 'properties' in schema:
+                        params = ', '.join(schema['properties'].keys())
+                        parts.append(f"    Parameters: {params}\n")
+            self._tools_fragment = "".join(parts)
+        return self._tools_fragment
+
+    def resources_fragment(self) -> str:
+        """AI-context section for this server's resources; same caching
+        contract as tools_fragment."""
+        if self._resources_fragment is None:
+            parts = []
+            try:
+                resources = self.list_resources() or []
+            except Exception:
+                resources = []
+            if resources:
+                parts.append(f"\nFrom {self.name}:\n")
+                for resource in resources[:10]:
+                    uri = resource.get('uri')
+                    name = resource.get('name', 'Unknown')
+                    parts.append(f"  • {name} ({uri})\n" if uri else f"  • {name}\n")
+            self._resources_fragment = "".join(parts)
+        return self._resources_fragment
+
     def stop(self) -> None:
-        
+
+        self._alive = False
         if self.process:
             try:
                 self.process.terminate()
@@ -331,14 +546,34 @@ class MCPConnection:
                 self.session = None
         
         self.initialized = False
+        self.invalidate_tools()
+        self.invalidate_resources()
 
 
 class MCPManager:
     
     
     def __init__(self):
-        self.connections: Dict[str, MCPConnection] = {}
+        # Copy-on-write registry: writers serialize on the lock and
+        # publish a fresh dict; `connections` is a read-only view
+        # rebound atomically, so readers iterate a stable snapshot
+        # without ever taking the lock.
+        self._conns: Dict[str, MCPConnection] = {}
+        self.connections: Mapping[str, MCPConnection] = MappingProxyType(self._conns)
         self.lock = Lock()
+        # Bumped whenever the connection set changes; callers use it as
+        # a cheap invalidation token for derived state (AI context).
+        self._version = 0
+
+    def _publish(self, conns: Dict[str, MCPConnection]) -> None:
+        """Swap in a new connection table. Caller holds self.lock."""
+        self._conns = conns
+        self.connections = MappingProxyType(conns)
+        self._version += 1
+
+    def version(self) -> int:
+
+        return self._version
     
     def start_server(
         self, 
@@ -350,67 +585,102 @@ class MCPManager:
         env: Optional[Dict[str, str]] = None
     ) -> bool:
         
-        with self.lock:
-            if name in self.connections:
-                return True  
-            
-            connection = MCPConnection(
-                name=name,
-                transport=transport,
-                command=command,
-                args=args,
-                url=url,
-                env=env
-            )
-            
-            if connection.start():
-                self.connections[name] = connection
-                return True
-            return False
-    
+        if name in self.connections:
+            return True
+
+        # Spawn and handshake outside the lock so independent servers
+        # can start concurrently; only the registry update is guarded.
+        connection = MCPConnection(
+            name=name,
+            transport=transport,
+            command=command,
+            args=args,
+            url=url,
+            env=env
+        )
+
+        if connection.start():
+            with self.lock:
+                if name in self._conns:
+                    # Another caller won the race; keep theirs.
+                    connection.stop()
+                    return True
+                self._publish({**self._conns, name: connection})
+            return True
+        return False
+
     def stop_server(self, name: str) -> None:
-        
+
         with self.lock:
-            if name in self.connections:
-                self.connections[name].stop()
-                del self.connections[name]
-    
+            connection = self._conns.get(name)
+            if connection is not None:
+                connection.stop()
+                remaining = dict(self._conns)
+                del remaining[name]
+                self._publish(remaining)
+
     def stop_all(self) -> None:
-        
+
         with self.lock:
-            for connection in self.connections.values():
+            for connection in self._conns.values():
                 connection.stop()
-            self.connections.clear()
+            if self._conns:
+                self._publish({})
     
     def get_connection(self, name: str) -> Optional[MCPConnection]:
         
         return self.connections.get(name)
     
     def is_connected(self, name: str) -> bool:
-        
+
         conn = self.connections.get(name)
         return conn is not None and conn.initialized
+
+    def connections_snapshot(self) -> List[MCPConnection]:
+
+        return list(self.connections.values())
+
+    def connection_status(self) -> Dict[str, bool]:
+        """Snapshot of every connection's state, for callers that would
+        otherwise poll is_connected per server."""
+        return {name: conn.initialized for name, conn in self.connections.items()}
     
-    def get_all_resources(self) -> Dict[str, List[Dict[str, Any]]]:
-        
-        all_resources = {}
-        for name, connection in self.connections.items():
+    def _fan_out(self, method_name: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Issue one RPC per connection concurrently and collect the
+        non-empty results. Each connection owns its own pipe or socket,
+        so the per-server waits overlap instead of summing."""
+        connections = list(self.connections.items())
+        if not connections:
+            return {}
+
+        def query(connection: MCPConnection) -> Optional[List[Dict[str, Any]]]:
             try:
-                resources = connection.list_resources()
-                if resources:
-                    all_resources[name] = resources
+                return getattr(connection, method_name)()
             except Exception:
-                pass
-        return all_resources
-    
+                return None
+
+        if len(connections) == 1:
+            # No pool for the common single-server setup.
+            name, connection = connections[0]
+            result = query(connection)
+            return {name: result} if result else {}
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(16, len(connections))) as executor:
+            futures = {
+                name: executor.submit(query, connection)
+                for name, connection in connections
+            }
+            for name, future in futures.items():
+                result = future.result()
+                if result:
+                    results[name] = result
+        return results
+
+    def get_all_resources(self) -> Dict[str, List[Dict[str, Any]]]:
+
+        return self._fan_out("list_resources")
+
     def get_all_tools(self) -> Dict[str, List[Dict[str, Any]]]:
-        
-        all_tools = {}
-        for name, connection in self.connections.items():
-            try:
-                tools = connection.list_tools()
-                if tools:
-                    all_tools[name] = tools
-            except Exception:
-                pass
-        return all_tools
\ No newline at end of file
+
+        return self._fan_out("list_tools")
\ No newline at end of file
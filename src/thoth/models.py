@@ -1,27 +1,156 @@
-from typing import Tuple, List
+from typing import Tuple, List, Optional
 import getpass
+import json
+import os
+import threading
+import time
+from pathlib import Path
 from openai import OpenAI
 from .config import load_config, save_config
 from .display import console, select_with_arrows, select_model_interactive
 
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
 
 PROVIDERS = {
     "OpenAI": "api.openai.com",
     "OpenRouter": "openrouter.ai"
 }
 
+_HTTP_SESSION = None
+
+# Each OpenAI() constructs a fresh httpx client with TLS setup; reuse
+# them per (api_key, base_url) so validation and the chat client share
+# one connection pool.
+_CLIENT_CACHE = {}
+
+
+def _get_client(api_key: str, base_url: str = None) -> OpenAI:
+
+    key = (api_key, base_url)
+    client = _CLIENT_CACHE.get(key)
+    if client is None:
+        if base_url:
+            client = OpenAI(api_key=api_key, base_url=base_url)
+        else:
+            client = OpenAI(api_key=api_key)
+        _CLIENT_CACHE[key] = client
+    return client
+
+# Model lists change slowly; cache them on disk with stale-while-
+# revalidate semantics: a fresh cache is served as-is, a stale one is
+# served immediately while a background thread refreshes it, and only a
+# missing cache blocks on the network. /model and startup with a saved
+# key are therefore instant and survive being offline; flows that
+# validate a freshly entered key pass force_refresh instead.
+_MODELS_CACHE_TTL = 3600
 
-def fetch_openai_models(api_key: str) -> List[str]:
-    """Fetch available models from OpenAI."""
+_REFRESH_LOCK = threading.Lock()
+_REFRESHING = set()
+
+
+def _models_cache_path(provider: str) -> Path:
+
+    return Path.home() / f".thoth_models_{provider.lower()}.json"
+
+
+def _read_models_cache(provider: str) -> Tuple[Optional[List[str]], bool]:
+    """Return (models, fresh); models is None when there is no usable cache."""
+    path = _models_cache_path(provider)
     try:
-        client = OpenAI(api_key=api_key)
+        fresh = time.time() - path.stat().st_mtime < _MODELS_CACHE_TTL
+        models = json.loads(path.read_text(encoding="utf-8"))
+        if models:
+            return models, fresh
+    except (OSError, ValueError):
+        pass
+    return None, False
+
+
+def _write_models_cache(provider: str, models: List[str]) -> None:
+
+    # Written via a same-directory temp file + os.replace so a reader
+    # (or a concurrent background refresh) never sees a partial file.
+    path = _models_cache_path(provider)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_text(json.dumps(models), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _refresh_in_background(provider: str, fetch) -> None:
+    """Run one cache-refreshing fetch per provider at a time."""
+    with _REFRESH_LOCK:
+        if provider in _REFRESHING:
+            return
+        _REFRESHING.add(provider)
+
+    def worker():
+        try:
+            fetch()
+        except Exception:
+            pass  # stale data stays served; next stale read retries
+        finally:
+            with _REFRESH_LOCK:
+                _REFRESHING.discard(provider)
+
+    threading.Thread(target=worker, daemon=True).start()
+
+
+def _http_session():
+    """Shared client for model-list fetches, created once per process:
+    httpx with HTTP/2 when available, else a keep-alive requests
+    session, so repeat fetches reuse the TLS connection."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        if httpx is not None:
+            try:
+                _HTTP_SESSION = httpx.Client(http2=True, timeout=10)
+            except ImportError:
+                _HTTP_SESSION = httpx.Client(timeout=10)
+        else:
+            import requests
+            _HTTP_SESSION = requests.Session()
+    return _HTTP_SESSION
+
+
+def fetch_openai_models(api_key: str, force_refresh: bool = False) -> List[str]:
+    """Fetch available models from OpenAI.
+
+    force_refresh bypasses the disk cache; validation flows need the
+    network round-trip so a bad key fails instead of being masked by a
+    list cached under an earlier (valid) key.
+    """
+    cached, fresh = (None, False) if force_refresh else _read_models_cache("openai")
+    if cached is not None:
+        if not fresh:
+            _refresh_in_background(
+                "openai", lambda: _fetch_openai_models_remote(api_key)
+            )
+        return cached
+    return _fetch_openai_models_remote(api_key)
+
+
+def _fetch_openai_models_remote(api_key: str) -> List[str]:
+
+    try:
+        client = _get_client(api_key)
         models = client.models.list()
         
+        # Single C-level prefix check against a tuple, instead of a
+        # generator of substring scans per model.
         chat_models = [
-            model.id for model in models.data 
-            if any(prefix in model.id for prefix in ["gpt-4", "gpt-3.5"])
+            model.id for model in models.data
+            if model.id.startswith(("gpt-4", "gpt-3.5"))
         ]
-        return sorted(chat_models, reverse=True)
+        chat_models = sorted(chat_models, reverse=True)
+        _write_models_cache("openai", chat_models)
+        return chat_models
     except Exception as e:
         error_msg = str(e).lower()
         if "authentication" in error_msg or "api key" in error_msg or "401" in error_msg:
@@ -34,12 +163,51 @@ def fetch_openai_models(api_key: str) -> List[str]:
             raise ValueError(f"Error fetching OpenAI models: {e}")
 
 
-def fetch_openrouter_models(api_key: str) -> List[str]:
-    """Fetch available models from OpenRouter."""
+# Preferred-model ordering for the OpenRouter picker. The rank map is
+# built once; the sort key probes it with one slice per distinct prefix
+# length (longest first) instead of scanning every prefix per model.
+_PRIORITY_PREFIXES = (
+    "anthropic/claude-3.5",
+    "anthropic/claude-3",
+    "openai/gpt-4",
+    "google/gemini",
+    "meta-llama/llama-3",
+    "mistralai/",
+    "deepseek/",
+)
+_PREFIX_RANK = {prefix: i for i, prefix in enumerate(_PRIORITY_PREFIXES)}
+_PREFIX_LENGTHS = sorted({len(p) for p in _PRIORITY_PREFIXES}, reverse=True)
+_DEFAULT_RANK = len(_PRIORITY_PREFIXES)
+
+
+def _openrouter_sort_key(model_id: str) -> tuple:
+
+    for length in _PREFIX_LENGTHS:
+        rank = _PREFIX_RANK.get(model_id[:length])
+        if rank is not None:
+            return (rank, model_id)
+    return (_DEFAULT_RANK, model_id)
+
+
+def fetch_openrouter_models(api_key: str, force_refresh: bool = False) -> List[str]:
+    """Fetch available models from OpenRouter.
+
+    force_refresh bypasses the disk cache; see fetch_openai_models.
+    """
+    cached, fresh = (None, False) if force_refresh else _read_models_cache("openrouter")
+    if cached is not None:
+        if not fresh:
+            _refresh_in_background(
+                "openrouter", lambda: _fetch_openrouter_models_remote(api_key)
+            )
+        return cached
+    return _fetch_openrouter_models_remote(api_key)
+
+
+def _fetch_openrouter_models_remote(api_key: str) -> List[str]:
+
     try:
-        import requests
-        
-        response = requests.get(
+        response = _http_session().get(
             "https://openrouter.ai/api/v1/models",
             headers={
                 "Authorization": f"Bearer {api_key}",
@@ -62,37 +230,25 @@ def fetch_openrouter_models(api_key: str) -> List[str]:
         models_data = response.json()
         
         model_ids = [model["id"] for model in models_data.get("data", [])]
-        
+
         if not model_ids:
             raise ValueError("No models available from OpenRouter.")
-        
-        # Sort models by priority
-        priority_prefixes = [
-            "anthropic/claude-3.5",
-            "anthropic/claude-3",
-            "openai/gpt-4",
-            "google/gemini",
-            "meta-llama/llama-3",
-            "mistralai/",
-            "deepseek/",
-        ]
-        
-        def sort_key(model_id: str) -> tuple:
-            for i, prefix in enumerate(priority_prefixes):
-                if model_id.startswith(prefix):
-                    return (i, model_id)
-            return (len(priority_prefixes), model_id)
-        
-        return sorted(model_ids, key=sort_key)
-    
-    except requests.exceptions.Timeout:
-        raise ValueError("Request timeout. Please check your internet connection.")
-    except requests.exceptions.ConnectionError:
-        raise ValueError("Connection error. Please check your internet connection.")
+
+        model_ids = sorted(model_ids, key=_openrouter_sort_key)
+        _write_models_cache("openrouter", model_ids)
+        return model_ids
+
     except ValueError:
         # Re-raise our custom ValueError messages
         raise
     except Exception as e:
+        # The session may be httpx or requests; map by exception class
+        # name instead of importing both hierarchies.
+        kind = type(e).__name__.lower()
+        if "timeout" in kind:
+            raise ValueError("Request timeout. Please check your internet connection.")
+        if "connect" in kind:
+            raise ValueError("Connection error. Please check your internet connection.")
         raise ValueError(f"Error fetching OpenRouter models: {e}")
 
 
@@ -117,10 +273,14 @@ def choose_provider_and_model(reset: bool = False) -> Tuple[OpenAI, str, str]:
             console.print("[red]No provider selected. Exiting.[/red]")
             raise SystemExit(1)
     
-    # Get API key
+    # Get API key. A key loaded from config was validated when it was
+    # first entered, so model fetches for it may be served from cache;
+    # a freshly typed key must be validated against the network.
+    key_entered = False
     if config.get("api_key") and not reset:
         api_key = config["api_key"]
     else:
+        key_entered = True
         console.print(f"\n[bold]Enter your {provider} API key:[/bold]")
         console.print("[dim](Your input will be hidden)[/dim]")
         api_key = getpass.getpass("API Key: ").strip()
@@ -138,9 +298,9 @@ def choose_provider_and_model(reset: bool = False) -> Tuple[OpenAI, str, str]:
         
         try:
             if provider == "OpenAI":
-                model_list = fetch_openai_models(api_key)
+                model_list = fetch_openai_models(api_key, force_refresh=key_entered)
             else:  # OpenRouter
-                model_list = fetch_openrouter_models(api_key)
+                model_list = fetch_openrouter_models(api_key, force_refresh=key_entered)
             
             console.print(f"[green]✓ API key validated successfully[/green]")
             console.print(f"[green]✓ Found {len(model_list)} models[/green]\n")
@@ -161,12 +321,9 @@ def choose_provider_and_model(reset: bool = False) -> Tuple[OpenAI, str, str]:
     
     # Create client
     if provider == "OpenAI":
-        client = OpenAI(api_key=api_key)
+        client = _get_client(api_key)
     else:  # OpenRouter
-        client = OpenAI(
-            api_key=api_key,
-            base_url="https://openrouter.ai/api/v1"
-        )
+        client = _get_client(api_key, base_url="https://openrouter.ai/api/v1")
     
     # Save configuration
     if not config or reset:
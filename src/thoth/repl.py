@@ -1,14 +1,20 @@
 """REPL implementation for interactive chat."""
 
+import bisect
 import json
+import shlex
 import subprocess
 import atexit
 import re
+import traceback
 import getpass
+import hashlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from threading import Thread
 from typing import Optional, Dict
-import typer
 from openai import OpenAI
 from prompt_toolkit import PromptSession
 from prompt_toolkit.completion import Completer, Completion
@@ -34,12 +40,19 @@ from .mcp import (
 )
 from .gcp import (
     configure_gcp_interactive,
-    get_gcp_context_for_ai
+    get_gcp_context_for_ai,
+    json_dumps,
+    json_loads,
+    load_gcp_config,
+    run_gcloud_command
 )
 from .infrastructure import (
     analyze_infrastructure_interactive,
     view_stored_knowledge_interactive,
-    get_infrastructure_context_for_ai
+    get_infrastructure_context_for_ai,
+    has_stored_knowledge,
+    auto_refresh_knowledge,
+    update_knowledge_for_ai
 )
 from .ssh import (
     configure_ssh_interactive,
@@ -49,6 +62,126 @@ from .ssh import (
 )
 
 
+try:
+    import reru  # Rust-backed regex engine, drop-in for this pattern
+except ImportError:
+    reru = None
+
+# Compiled once; process_file_mentions runs on every chat turn. The
+# Rust engine is noticeably faster on multi-KB pasted messages and is
+# used automatically when installed.
+_MENTION_PATTERN = r'@([\w\-./]+\.\w+)'
+if reru is not None:
+    _FILE_MENTION_RE = reru.compile(_MENTION_PATTERN)
+else:
+    _FILE_MENTION_RE = re.compile(_MENTION_PATTERN)
+
+_FILE_BANNER = "\n\n" + "=" * 80 + "\nATTACHED FILES\n" + "=" * 80
+
+# Extensions worth opening at all; anything else is rejected before any
+# path resolution or syscall. Files that pass but turn out to be binary
+# still hit the UnicodeDecodeError fallback below.
+_TEXT_EXTS = frozenset({
+    '.txt', '.py', '.js', '.ts', '.json', '.yaml', '.yml', '.md', '.toml',
+    '.ini', '.cfg', '.sh', '.html', '.css', '.c', '.cpp', '.h', '.rs',
+    '.go', '.java', '.rb', '.php', '.xml', '.sql', '.env', '.gitignore',
+    '.dockerfile', '.conf', '.log',
+})
+
+_mcp_initialized = False
+
+
+def _ensure_mcp() -> None:
+    """Spawn the configured MCP servers on first need, so sessions that
+    never chat (or only run slash commands) skip the startup cost."""
+    global _mcp_initialized
+    if not _mcp_initialized:
+        console.print("[dim]Initializing MCP servers...[/dim]")
+        initialize_mcp_servers()
+        atexit.register(shutdown_mcp_servers)
+        _mcp_initialized = True
+
+
+# Characters that need a real shell (pipes, redirection, expansion,
+# quoting...). Anything without them runs as a plain argv exec.
+_SHELL_META = frozenset('|&;<>()$`\\"\'*?[]#~=%\n')
+
+# (signature, tools) for the OpenAI tools list, which is identical from
+# turn to turn unless the MCP connection set or the GCP/SSH tool
+# availability changes.
+_TOOLS_CACHE = None
+
+# One spinner for the whole process; each turn just updates its text
+# instead of re-parsing the frame pattern.
+_SPINNER = Spinner("circle", style="#B8860B")
+
+# Shared styling for the per-turn response panel; only the body changes
+# between turns, so the title/border/padding markup is parsed once.
+_AI_PANEL_KW = dict(
+    title="[bold #B8860B]Thoth[/bold #B8860B]",
+    border_style="#B8860B",
+    padding=(1, 2),
+)
+
+
+def _read_one_mention(file_path: str) -> str:
+    """Resolve and read a single @-mentioned file, returning the
+    formatted snippet for the enhanced message."""
+    try:
+        if Path(file_path).suffix.lower() not in _TEXT_EXTS:
+            console.print(f"[yellow]⚠️  Unsupported file type: {file_path}[/yellow]")
+            return f"\n[File: {file_path}]\n⚠️  Unsupported file type. Only text files can be attached.\n"
+
+        # Resolve path
+        path = Path(file_path).expanduser()
+
+        # Try relative to current directory if not absolute
+        if not path.is_absolute():
+            path = Path.cwd() / file_path
+
+        # One bounded binary read replaces the exists/stat/read_text
+        # sequence: a single syscall pulls at most the cap plus one
+        # byte, and the size check falls out of the length.
+        try:
+            with open(path, 'rb') as f:
+                data = f.read(100_001)
+        except FileNotFoundError:
+            console.print(f"[yellow]⚠️  File not found: {file_path}[/yellow]")
+            return f"\n[File: {file_path}]\n⚠️  File not found: {path}\n"
+
+        # Check file size (limit to 100KB)
+        if len(data) > 100_000:
+            console.print(f"[yellow]⚠️  File too large: {file_path} (>100KB)[/yellow]")
+            return f"\n[File: {file_path}]\n⚠️  File too large (>100KB). Please use a smaller file.\n"
+
+        try:
+            content = data.decode('utf-8')
+        except UnicodeDecodeError:
+            # Binary file
+            console.print(f"[yellow]⚠️  Binary file: {file_path}[/yellow]")
+            return f"\n[File: {file_path}]\n⚠️  Binary file detected. Cannot display content.\n"
+
+        console.print(f"[dim]📄 Reading file: {file_path}[/dim]")
+        return f"\n[File: {file_path}]\n```\n{content}\n```\n"
+
+    except Exception as e:
+        console.print(f"[yellow]⚠️  Error reading {file_path}: {str(e)}[/yellow]")
+        return f"\n[File: {file_path}]\n⚠️  Error reading file: {str(e)}\n"
+
+
+def _extract_mentions(message: str) -> list:
+    """Mentioned file paths, deduped in first-mention order.
+
+    re's findall yields the capture group ("demo.txt"); reru's yields
+    the whole match ("@demo.txt"), so the '@' is stripped here rather
+    than trusting the engine's group semantics.
+    """
+    return list(dict.fromkeys(
+        m[1:] if m.startswith('@') else m
+        for m in _FILE_MENTION_RE.findall(message)
+    ))
+
+
 def process_file_mentions(message: str) -> str:
     """
     Process @file mentions in the message and include file contents.
@@ -58,58 +191,25 @@ def process_file_mentions(message: str) -> str:
     - @./path/to/file.py
     - @/absolute/path/file.json
     """
-    # Find all @file mentions
-    pattern = r'@([\w\-./]+\.\w+)'
-    matches = re.findall(pattern, message)
-    
+    # Cheap literal scan first; most messages mention no files at all.
+    if '@' not in message:
+        return message
+
+    matches = _extract_mentions(message)
+
     if not matches:
         return message
     
-    enhanced_message = message
-    file_contents = []
-    
-    for file_path in matches:
-        try:
-            # Resolve path
-            path = Path(file_path).expanduser()
-            
-            # Try relative to current directory if not absolute
-            if not path.is_absolute():
-                path = Path.cwd() / file_path
-            
-            if not path.exists():
-                file_contents.append(f"\n[File: {file_path}]\n⚠️  File not found: {path}\n")
-                console.print(f"[yellow]⚠️  File not found: {file_path}[/yellow]")
-                continue
-            
-            # Check file size (limit to 100KB)
-            if path.stat().st_size > 100_000:
-                file_contents.append(f"\n[File: {file_path}]\n⚠️  File too large (>100KB). Please use a smaller file.\n")
-                console.print(f"[yellow]⚠️  File too large: {file_path} (>100KB)[/yellow]")
-                continue
-            
-            # Read file content
-            try:
-                content = path.read_text(encoding='utf-8')
-                file_contents.append(f"\n[File: {file_path}]\n```\n{content}\n```\n")
-                console.print(f"[dim]📄 Reading file: {file_path}[/dim]")
-            except UnicodeDecodeError:
-                # Binary file
-                file_contents.append(f"\n[File: {file_path}]\n⚠️  Binary file detected. Cannot display content.\n")
-                console.print(f"[yellow]⚠️  Binary file: {file_path}[/yellow]")
-        
-        except Exception as e:
-            file_contents.append(f"\n[File: {file_path}]\n⚠️  Error reading file: {str(e)}\n")
-            console.print(f"[yellow]⚠️  Error reading {file_path}: {str(e)}[/yellow]")
-    
-    # Append all file contents to the message
-    if file_contents:
-        enhanced_message += "\n\n" + "="*80 + "\n"
-        enhanced_message += "ATTACHED FILES\n"
-        enhanced_message += "="*80
-        enhanced_message += "".join(file_contents)
-    
-    return enhanced_message
+    # The reads are independent I/O; overlap them on a small pool.
+    # executor.map preserves mention order in the output.
+    if len(matches) == 1:
+        file_contents = [_read_one_mention(matches[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(matches))) as executor:
+            file_contents = list(executor.map(_read_one_mention, matches))
+
+    # Append all file contents to the message in one concatenation
+    return message + _FILE_BANNER + "".join(file_contents)
 
 
 def is_infrastructure_related_query(message: str) -> bool:
@@ -180,6 +280,254 @@ def is_infrastructure_related_query(message: str) -> bool:
     return False
 
 
+def _handle_gcp_exec(function_args: dict, gcp_config: dict) -> dict:
+    """Run a gcloud command for the AI and refresh stored knowledge
+    after modification commands."""
+    args = function_args.get("args", [])
+    output_format = function_args.get("format", "json")
+    project_id = gcp_config.get("project_id")
+
+    # One pass over args spots both an explicit --format flag and the
+    # first modification verb, replacing two separate scans (one of
+    # them a per-arg substring search).
+    has_format = False
+    verb = None
+    verb_index = -1
+    for i, arg in enumerate(args):
+        if not has_format and arg.startswith("--format"):
+            has_format = True
+        if verb is None and arg in _MODIFICATION_COMMANDS:
+            verb = arg
+            verb_index = i
+
+    # Add format flag if not already present
+    if output_format and not has_format:
+        args.append(f"--format={output_format}")
+
+    console.print(f"\n[dim]⚙️ [#4682B4]gcloud {' '.join(args)}[/#4682B4][/dim]")
+
+    output = run_gcloud_command(args, project_id=project_id)
+
+    if not output:
+        return {
+            "success": False,
+            "error": "Command failed or returned no output",
+            "command": f"gcloud {' '.join(args)}"
+        }
+
+    # Truncate very large outputs to prevent JSON parsing issues
+    max_output_size = 50000  # 50KB limit
+    if len(output) > max_output_size:
+        output = output[:max_output_size] + "\n\n[Output truncated - too large]"
+
+    tool_result = {
+        "success": True,
+        "output": output,
+        "command": f"gcloud {' '.join(args)}"
+    }
+
+    # Auto-refresh knowledge if this was a modification command
+    if verb:
+        # Check if knowledge exists before refreshing
+        if has_stored_knowledge(project_id):
+            # For single-instance changes, hint the refresh so it
+            # patches one entry instead of re-scanning the whole
+            # project.
+            changed = None
+            if "instances" in args and verb != "delete":
+                if verb_index + 1 < len(args) and not args[verb_index + 1].startswith("-"):
+                    changed = ("instance", args[verb_index + 1])
+            auto_refresh_knowledge(project_id, changed)
+
+    return tool_result
+
+
+def _handle_update_knowledge(function_args: dict, gcp_config: dict) -> dict:
+
+    console.print(f"\n[dim]📚 [#4682B4]Updating infrastructure knowledge...[/#4682B4][/dim]")
+
+    result = update_knowledge_for_ai(gcp_config.get("project_id"))
+
+    if result["success"]:
+        return result
+    return {
+        "success": False,
+        "error": result.get("error", "Failed to update knowledge")
+    }
+
+
+def _handle_ssh_exec(function_args: dict, gcp_config: dict) -> dict:
+
+    host = function_args.get("host", "")
+    command = function_args.get("command", "")
+
+    if not host or not command:
+        return {
+            "success": False,
+            "error": "Both 'host' and 'command' are required"
+        }
+
+    console.print(f"\n[dim]🔐 [#4682B4]ssh {host}: {command}[/#4682B4][/dim]")
+
+    result = run_ssh_command(host=host, command=command, timeout=60)
+
+    if result:
+        # Truncate large outputs
+        stdout = result["stdout"]
+        stderr = result["stderr"]
+        max_output_size = 10000  # 10KB limit for SSH
+
+        if len(stdout) > max_output_size:
+            stdout = stdout[:max_output_size] + "\n[Output truncated]"
+        if len(stderr) > max_output_size:
+            stderr = stderr[:max_output_size] + "\n[Output truncated]"
+
+        return {
+            "success": result["success"],
+            "stdout": stdout,
+            "stderr": stderr,
+            "return_code": result["return_code"],
+            "host": host,
+            "command": command
+        }
+    return {
+        "success": False,
+        "error": "Failed to execute SSH command",
+        "host": host,
+        "command": command
+    }
+
+
+# Completed responses keyed by a hash of the full request state
+# (model, message history, tool schemas). A repeated question in an
+# identical context becomes a disk read instead of an LLM round-trip;
+# any difference in history or tools changes the key, so hits are
+# semantically safe. Cleared by /clear along with the history.
+_RESPONSE_CACHE_DIR = Path.home() / ".thoth_response_cache"
+
+
+def _response_cache_key(model: str, messages: list, tools: list) -> str:
+
+    payload = json_dumps({"model": model, "messages": messages, "tools": tools or []})
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _response_cache_get(key: str) -> Optional[str]:
+
+    try:
+        return (_RESPONSE_CACHE_DIR / key).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _response_cache_put(key: str, content: str) -> None:
+
+    try:
+        _RESPONSE_CACHE_DIR.mkdir(mode=0o700, exist_ok=True)
+        (_RESPONSE_CACHE_DIR / key).write_text(content, encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _response_cache_clear() -> None:
+
+    try:
+        for entry in _RESPONSE_CACHE_DIR.iterdir():
+            entry.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+# gcloud verbs that change state and should trigger a knowledge
+# refresh after they succeed.
+_MODIFICATION_COMMANDS = frozenset({
+    "create", "delete", "update", "add", "remove",
+    "start", "stop", "reset", "set-machine-type",
+    "attach-disk", "detach-disk", "add-tags", "remove-tags",
+})
+
+# O(1) router for the built-in tools; anything else is treated as an
+# MCP tool in the dispatch loop.
+_TOOL_HANDLERS = {
+    "gcp_execute_command": _handle_gcp_exec,
+    "update_infrastructure_knowledge": _handle_update_knowledge,
+    "ssh_execute_command": _handle_ssh_exec,
+}
+
+
+class BoundedChatHistory:
+    """Chat history with bounded growth.
+
+    The system prompt (and an optional rolling summary slot) stay
+    pinned while only the most recent messages are kept, so API request
+    size and serialization cost stop scaling with session length.
+    """
+
+    # Messages older than this many positions get their bulky tool
+    # outputs stubbed out before each send; results smaller than the
+    # threshold aren't worth replacing.
+    _VERBATIM_TAIL = 8
+    _TOOL_STUB_THRESHOLD = 512
+
+    def __init__(self, system_prompt: Optional[dict] = None, max_recent: int = 20):
+        self.system_prompt = system_prompt
+        self.summary: Optional[dict] = None
+        self.recent: deque = deque(maxlen=max_recent)
+        # Full content of stubbed tool results, keyed by digest, kept
+        # so a future re-inspect path can restore them on demand.
+        self._stash: dict = {}
+
+    def append(self, message: dict) -> None:
+        self.recent.append(message)
+
+    def pop(self) -> dict:
+        return self.recent.pop()
+
+    def last(self) -> Optional[dict]:
+        return self.recent[-1] if self.recent else None
+
+    def clear(self) -> None:
+        self.summary = None
+        self.recent.clear()
+        self._stash.clear()
+
+    def _compact(self) -> None:
+        """Stub out bulky tool outputs that have aged past the verbatim
+        tail, so old 30KB results stop being re-sent every turn. The
+        full content moves to the stash, keyed by digest."""
+        cutoff = len(self.recent) - self._VERBATIM_TAIL
+        for i, message in enumerate(self.recent):
+            if i >= cutoff:
+                break
+            if message.get("role") != "tool":
+                continue
+            content = message.get("content") or ""
+            if len(content) <= self._TOOL_STUB_THRESHOLD or content.startswith('{"truncated"'):
+                continue
+            digest = hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+            self._stash[digest] = content
+            message["content"] = json_dumps(
+                {"truncated": True, "sha": digest, "bytes": len(content)}
+            )
+
+    def messages(self) -> list:
+        """Messages to send to the API: pinned head plus recent turns."""
+        self._compact()
+        head = []
+        if self.system_prompt:
+            head.append(self.system_prompt)
+        if self.summary:
+            head.append(self.summary)
+        recent = list(self.recent)
+        # Eviction can leave a tool result whose originating assistant
+        # tool_calls message has aged out; the API rejects such a run,
+        # so drop orphaned leading tool messages.
+        start = 0
+        while start < len(recent) and recent[start].get("role") == "tool":
+            start += 1
+        return head + recent[start:]
+
+
 class SlashCompleter(Completer):
     """Beautiful auto-completer for slash commands with rich formatting."""
     
@@ -191,56 +539,46 @@ class SlashCompleter(Completer):
             commands: Dict mapping command names to descriptions
         """
         self.commands = commands
+        # Sorted lowercase keys with displays built once: completion
+        # bisects straight to the prefix range and reuses the same
+        # FormattedText instead of rebuilding it per keystroke.
+        self._sorted = sorted(
+            (
+                name.lower(),
+                name,
+                FormattedText([
+                    ('class:command-slash', '/'),
+                    ('class:command-name', name),
+                    ('class:command-separator', ' — '),
+                    ('class:command-desc', desc),
+                ]),
+            )
+            for name, desc in commands.items()
+        )
+        self._keys = [entry[0] for entry in self._sorted]
 
     def get_completions(self, document, complete_event):
         text = document.text_before_cursor.lstrip()
-        
+
         # Only complete if starts with /
         if not text.startswith("/"):
             return
-        
+
         # Get the partial command (without the /)
         partial = text[1:].lower()
-        
-        # Find matching commands
-        for cmd_name, cmd_desc in self.commands.items():
-            cmd_lower = cmd_name.lower()
-            
-            # Match if command starts with partial input
-            if cmd_lower.startswith(partial):
-                # Create formatted display with icon
-                icon = self._get_command_icon(cmd_name)
-                
-                # Format: /command — description
-                display = FormattedText([
-                    ('class:command-slash', '/'),
-                    ('class:command-name', cmd_name),
-                    ('class:command-separator', ' — '),
-                    ('class:command-desc', cmd_desc),
-                ])
-                
-                yield Completion(
-                    text=cmd_name,
-                    start_position=-len(text) + 1,  # +1 to keep the /
-                    display=display,
-                )
-    
-    def _get_command_icon(self, cmd_name: str) -> str:
-        """Get emoji icon for command."""
-        icons = {
-            "help": "📖",
-            "provider": "🔄",
-            "model": "🤖",
-            "clear": "🧹",
-            "reset": "♻️",
-            "mcp": "🔌",
-            "gcp": "☁️",
-            "ssh": "🔐",
-            "analyze": "🔍",
-            "knowledge": "📚",
-            "exit": "👋"
-        }
-        return icons.get(cmd_name, "•")
+
+        # Jump to the first candidate; matches are contiguous from here.
+        start = bisect.bisect_left(self._keys, partial)
+        for i in range(start, len(self._sorted)):
+            cmd_lower, cmd_name, display = self._sorted[i]
+            if not cmd_lower.startswith(partial):
+                break
+
+            yield Completion(
+                text=cmd_name,
+                start_position=-len(text) + 1,  # +1 to keep the /
+                display=display,
+            )
 
 
 # Custom style for the completer - darker theme
@@ -261,25 +599,61 @@ completer_style = Style.from_dict({
 })
 
 
-def show_session_banner(provider: str, model: str) -> None:
-    """Display the session banner with current provider and model."""
-    console.print(Align.center(Panel(
+# Built once at import; /help reprints the same renderable instead of
+# re-assembling the markup and re-parsing it on every invocation.
+_HELP_PANEL = Panel(
+    "[bold cyan]💬 Chat Commands[/bold cyan]\n\n"
+    "[bold]/help[/bold] — show this help menu\n"
+    "[bold]/provider[/bold] — switch AI provider (OpenAI ↔ OpenRouter)\n"
+    "[bold]/model[/bold] — change AI model\n"
+    "[bold]/clear[/bold] — clear conversation history\n"
+    "[bold]/reset[/bold] — reset all settings and start fresh\n"
+    "[bold]/exit[/bold] — quit Thoth\n\n"
+    "[bold cyan]🔌 MCP Commands[/bold cyan]\n\n"
+    "[bold]/mcp[/bold] — manage MCP servers (add, list, remove, test)\n\n"
+    "[bold cyan]☁️  Cloud Platform Commands[/bold cyan]\n\n"
+    "[bold]/gcp[/bold] — configure GCP settings (project, region, zone)\n"
+    "[bold]/analyze[/bold] — analyze infrastructure and store knowledge\n"
+    "[bold]/knowledge[/bold] — view stored infrastructure knowledge\n\n"
+    "[bold cyan]🔐 Remote Access Commands[/bold cyan]\n\n"
+    "[bold]/ssh[/bold] — configure SSH hosts for remote command execution\n\n"
+    "[bold cyan]🖥️  Shell Commands[/bold cyan]\n\n"
+    "[bold]`<command>[/bold] — run local shell command\n"
+    "  Examples: `ls -la, `git status, `pwd\n\n"
+    "[bold cyan]📄 File Mentions[/bold cyan]\n\n"
+    "[bold]@filename[/bold] — mention a file to include its content\n"
+    "  Examples: @config.yaml, @./src/main.py, @/etc/hosts\n"
+    "  Supports: .txt, .py, .js, .json, .yaml, .md, etc.\n"
+    "  Max size: 100KB per file\n\n"
+    "[bold cyan]🤖 AI Capabilities[/bold cyan]\n\n"
+    "Chat naturally with AI and get intelligent responses.\n"
+    "MCP servers provide real-time context and capabilities.",
+    title="📜 Thoth Commands",
+    border_style="#B8860B",
+    padding=(1, 2)
+)
+
+
+@lru_cache(maxsize=8)
+def _session_banner(provider: str, model: str) -> Align:
+
+    return Align.center(Panel(
         f"[bold #B8860B]Thoth AI Interactive Shell[/bold #B8860B] — "
         f"[#4682B4]{provider}[/#4682B4] • [#4682B4]{model}[/#4682B4]\n"
         "[dim]Chat with AI • Run shell commands with ` • Type /help for commands[/dim]",
         border_style="gold1",
         expand=False
-    )))
+    ))
+
+
+def show_session_banner(provider: str, model: str) -> None:
+    """Display the session banner with current provider and model."""
+    console.print(_session_banner(provider, model))
 
 
 def run_repl(client: OpenAI, provider: str, model: str) -> None:
 
     show_session_banner(provider, model)
-    
-    console.print("[dim]Initializing MCP servers...[/dim]")
-    initialize_mcp_servers()
-    
-    atexit.register(shutdown_mcp_servers)
 
     slash_commands = {
         "help": "Show available commands and usage",
@@ -302,21 +676,186 @@ def run_repl(client: OpenAI, provider: str, model: str) -> None:
         complete_in_thread=True
     )
 
-    try:
-        system_prompt_text = load_system_prompt_from_md("./prompts/prompt.md")
-    except FileNotFoundError as e:
-        console.print(f"[red]{e}[/red]")
-        raise typer.Exit(1)
-    except ValueError as e:
-        console.print(f"[yellow]{e}[/yellow]")
-        raise typer.Exit(1)
-
-    system_prompt = {"role": "system", "content": system_prompt_text}
-    chat_history: list[dict] = [system_prompt]
+    # The prompt file is read lazily on the first chat message, so
+    # /help-or-/exit sessions never touch the disk for it.
+    system_prompt: Optional[dict] = None
+    chat_history = BoundedChatHistory()
     
     # Load MCP config for AI context
     mcp_config = load_mcp_config()
 
+    # Slash-command handlers, resolved with one dict lookup per turn
+    # instead of walking an if/elif ladder. Handlers close over the
+    # session state above and return True only when the REPL should
+    # exit.
+    def _cmd_help() -> None:
+        console.print(_HELP_PANEL)
+
+    def _cmd_mcp() -> None:
+        nonlocal mcp_config
+        _ensure_mcp()
+        configure_mcp_interactive()
+        mcp_config = load_mcp_config()
+
+    def _cmd_provider() -> None:
+        nonlocal client, provider, model
+        console.print("[cyan]🔄 Switching AI provider...[/cyan]\n")
+
+        # Select new provider
+        new_provider = select_with_arrows(
+            PROVIDERS,
+            prompt_text="Select AI Provider"
+        )
+
+        if not new_provider:
+            console.print("[yellow]Provider change cancelled[/yellow]\n")
+            return
+
+        # Get API key using getpass
+        console.print(f"\n[bold]Enter your {new_provider} API key:[/bold]")
+        console.print("[dim](Your input will be hidden)[/dim]")
+        api_key = getpass.getpass("API Key: ").strip()
+
+        if not api_key:
+            console.print("[yellow]No API key provided. Cancelled.[/yellow]\n")
+            return
+
+        # Validate API key by fetching models
+        console.print(f"[dim]Validating API key and fetching models from {new_provider}...[/dim]")
+
+        model_list = None
+        try:
+            # Bypass the model-list cache here: a cached hit would
+            # "validate" whatever key was just typed without any
+            # network I/O, then persist it.
+            if new_provider == "OpenAI":
+                model_list = fetch_openai_models(api_key, force_refresh=True)
+            else:
+                model_list = fetch_openrouter_models(api_key, force_refresh=True)
+
+            if not model_list:
+                console.print(f"[red]✗ No models available from {new_provider}.[/red]")
+                console.print(f"[red]The API key may be invalid or expired.[/red]\n")
+                return
+
+            console.print(f"[green]✓ API key validated successfully[/green]")
+            console.print(f"[green]✓ Found {len(model_list)} models[/green]\n")
+
+        except ValueError as e:
+            console.print(f"[red]✗ API key validation failed[/red]")
+            console.print(f"[red]{str(e)}[/red]\n")
+            console.print("[yellow]Please check your API key and try again.[/yellow]\n")
+            return
+        except Exception as e:
+            console.print(f"[red]✗ Unexpected error during validation[/red]")
+            console.print(f"[red]{str(e)}[/red]\n")
+            console.print("[yellow]Please try again.[/yellow]\n")
+            return
+
+        # Only proceed if we have a valid model list
+        if not model_list:
+            console.print("[yellow]Provider change cancelled[/yellow]\n")
+            return
+
+        new_model = select_model_interactive(model_list)
+
+        if not new_model:
+            console.print("[yellow]Model selection cancelled[/yellow]\n")
+            return
+
+        # Create new client
+        if new_provider == "OpenAI":
+            client = OpenAI(api_key=api_key)
+        else:  # OpenRouter
+            client = OpenAI(
+                api_key=api_key,
+                base_url="https://openrouter.ai/api/v1"
+            )
+
+        # Update variables
+        provider = new_provider
+        model = new_model
+
+        # Save configuration
+        save_config(provider, api_key, model)
+        console.print(f"[green]✓ Switched to {provider} • {model}[/green]\n")
+
+        # Show updated banner
+        show_session_banner(provider, model)
+
+        # Reset chat history
+        chat_history.clear()
+
+    def _cmd_model() -> None:
+        nonlocal model
+        # The saved key was validated when it was entered, so this list
+        # is served from the disk cache when fresh enough.
+        api_key = client.api_key
+        console.print(f"[dim]Fetching models from {provider}...[/dim]")
+        try:
+            if provider == "OpenAI":
+                model_list = fetch_openai_models(api_key)
+            else:
+                model_list = fetch_openrouter_models(api_key)
+        except ValueError as e:
+            console.print(f"[red]{str(e)}[/red]\n")
+            return
+
+        if not model_list:
+            console.print(f"[red]No models available from {provider}.[/red]\n")
+            return
+
+        new_model = select_model_interactive(model_list)
+
+        if not new_model:
+            console.print("[yellow]Model selection cancelled[/yellow]\n")
+            return
+
+        model = new_model
+        save_config(provider, api_key, model)
+        console.print(f"[green]✓ Model changed to {model}[/green]\n")
+        show_session_banner(provider, model)
+
+    def _cmd_clear() -> None:
+        chat_history.clear()
+        _response_cache_clear()
+        console.print("[green]✓ Conversation history cleared[/green]\n")
+
+    def _cmd_reset() -> None:
+        nonlocal client, provider, model
+        console.print("[yellow]🔄 Resetting all configuration...[/yellow]\n")
+        reset_config()
+        console.print("[green]✓ Configuration reset[/green]\n")
+        new_client, new_provider, new_model = choose_provider_and_model(reset=False)
+        client = new_client
+        provider = new_provider
+        model = new_model
+
+        # Show updated banner
+        show_session_banner(provider, model)
+
+        # Reset chat history
+        chat_history.clear()
+
+    def _cmd_exit() -> bool:
+        console.print("[bold #B8860B]Until the stars speak again.[/bold #B8860B]")
+        shutdown_mcp_servers()
+        return True
+
+    command_handlers = {
+        "help": _cmd_help,
+        "mcp": _cmd_mcp,
+        "gcp": configure_gcp_interactive,
+        "analyze": analyze_infrastructure_interactive,
+        "knowledge": view_stored_knowledge_interactive,
+        "ssh": configure_ssh_interactive,
+        "provider": _cmd_provider,
+        "model": _cmd_model,
+        "clear": _cmd_clear,
+        "reset": _cmd_reset,
+        "exit": _cmd_exit,
+    }
+
     while True:
         try:
             # Single unified prompt
@@ -328,8 +867,12 @@ def run_repl(client: OpenAI, provider: str, model: str) -> None:
             if not user_input:
                 continue
 
+            # One first-character test routes the turn; most inputs are
+            # chat messages and fall through both branches.
+            first = user_input[0]
+
             # Shell Command Mode (starts with `)
-            if user_input.startswith("`"):
+            if first == "`":
                 shell_cmd = user_input[1:].strip()
                 
                 if not shell_cmd:
@@ -337,13 +880,23 @@ def run_repl(client: OpenAI, provider: str, model: str) -> None:
                     continue
                 
                 try:
-                    result = subprocess.run(
-                        shell_cmd, 
-                        shell=True, 
-                        capture_output=True, 
-                        text=True,
-                        timeout=30
-                    )
+                    if _SHELL_META.isdisjoint(shell_cmd):
+                        # Simple command: exec it directly and save
+                        # spawning a shell interpreter per invocation.
+                        result = subprocess.run(
+                            shlex.split(shell_cmd),
+                            capture_output=True,
+                            text=True,
+                            timeout=30
+                        )
+                    else:
+                        result = subprocess.run(
+                            shell_cmd,
+                            shell=True,
+                            capture_output=True,
+                            text=True,
+                            timeout=30
+                        )
                     
                     # Display output
                     if result.stdout:
@@ -383,257 +936,131 @@ def run_repl(client: OpenAI, provider: str, model: str) -> None:
                 continue
 
             # Slash Commands
-            if user_input.startswith("/"):
+            if first == "/":
                 cmd = user_input[1:].strip().split(maxsplit=1)[0].lower()
 
-                if cmd == "help":
-                    console.print(Panel(
-                        "[bold cyan]💬 Chat Commands[/bold cyan]\n\n"
-                        "[bold]/help[/bold] — show this help menu\n"
-                        "[bold]/provider[/bold] — switch AI provider (OpenAI ↔ OpenRouter)\n"
-                        "[bold]/model[/bold] — change AI model\n"
-                        "[bold]/clear[/bold] — clear conversation history\n"
-                        "[bold]/reset[/bold] — reset all settings and start fresh\n"
-                        "[bold]/exit[/bold] — quit Thoth\n\n"
-                        "[bold cyan]🔌 MCP Commands[/bold cyan]\n\n"
-                        "[bold]/mcp[/bold] — manage MCP servers (add, list, remove, test)\n\n"
-                        "[bold cyan]☁️  Cloud Platform Commands[/bold cyan]\n\n"
-                        "[bold]/gcp[/bold] — configure GCP settings (project, region, zone)\n"
-                        "[bold]/analyze[/bold] — analyze infrastructure and store knowledge\n"
-                        "[bold]/knowledge[/bold] — view stored infrastructure knowledge\n\n"
-                        "[bold cyan]🔐 Remote Access Commands[/bold cyan]\n\n"
-                        "[bold]/ssh[/bold] — configure SSH hosts for remote command execution\n\n"
-                        "[bold cyan]🖥️  Shell Commands[/bold cyan]\n\n"
-                        "[bold]`<command>[/bold] — run local shell command\n"
-                        "  Examples: `ls -la, `git status, `pwd\n\n"
-                        "[bold cyan]📄 File Mentions[/bold cyan]\n\n"
-                        "[bold]@filename[/bold] — mention a file to include its content\n"
-                        "  Examples: @config.yaml, @./src/main.py, @/etc/hosts\n"
-                        "  Supports: .txt, .py, .js, .json, .yaml, .md, etc.\n"
-                        "  Max size: 100KB per file\n\n"
-                        "[bold cyan]🤖 AI Capabilities[/bold cyan]\n\n"
-                        "Chat naturally with AI and get intelligent responses.\n"
-                        "MCP servers provide real-time context and capabilities.",
-                        title="📜 Thoth Commands",
-                        border_style="#B8860B",
-                        padding=(1, 2)
-                    ))
-                
-                elif cmd == "mcp":
-                    configure_mcp_interactive()
-                    mcp_config = load_mcp_config()
-                
-                elif cmd == "gcp":
-                    configure_gcp_interactive()
-                
-                elif cmd == "analyze":
-                    analyze_infrastructure_interactive()
-                
-                elif cmd == "knowledge":
-                    view_stored_knowledge_interactive()
-
-                elif cmd == "ssh":
-                    configure_ssh_interactive()
-
-                elif cmd == "provider":
-                    console.print("[cyan]🔄 Switching AI provider...[/cyan]\n")
-                    
-                    # Select new provider
-                    new_provider = select_with_arrows(
-                        PROVIDERS,
-                        prompt_text="Select AI Provider"
-                    )
-                    
-                    if not new_provider:
-                        console.print("[yellow]Provider change cancelled[/yellow]\n")
-                        continue
-                    
-                    # Get API key using getpass
-                    console.print(f"\n[bold]Enter your {new_provider} API key:[/bold]")
-                    console.print("[dim](Your input will be hidden)[/dim]")
-                    api_key = getpass.getpass("API Key: ").strip()
-                    
-                    if not api_key:
-                        console.print("[yellow]No API key provided. Cancelled.[/yellow]\n")
-                        continue
-                    
-                    # Validate API key by fetching models
-                    console.print(f"[dim]Validating API key and fetching models from {new_provider}...[/dim]")
-                    
-                    model_list = None
-                    try:
-                        if new_provider == "OpenAI":
-                            model_list = fetch_openai_models(api_key)
-                        else:
-                            model_list = fetch_openrouter_models(api_key)
-                        
-                        if not model_list:
-                            console.print(f"[red]✗ No models available from {new_provider}.[/red]")
-                            console.print(f"[red]The API key may be invalid or expired.[/red]\n")
-                            continue
-                        
-                        console.print(f"[green]✓ API key validated successfully[/green]")
-                        console.print(f"[green]✓ Found {len(model_list)} models[/green]\n")
-                    
-                    except ValueError as e:
-                        console.print(f"[red]✗ API key validation failed[/red]")
-                        console.print(f"[red]{str(e)}[/red]\n")
-                        console.print("[yellow]Please check your API key and try again.[/yellow]\n")
-                        continue
-                    except Exception as e:
-                        console.print(f"[red]✗ Unexpected error during validation[/red]")
-                        console.print(f"[red]{str(e)}[/red]\n")
-                        console.print("[yellow]Please try again.[/yellow]\n")
-                        continue
-                    
-                    # Only proceed if we have a valid model list
-                    if not model_list:
-                        console.print("[yellow]Provider change cancelled[/yellow]\n")
-                        continue
-                    
-                    new_model = select_model_interactive(model_list)
-                    
-                    if not new_model:
-                        console.print("[yellow]Model selection cancelled[/yellow]\n")
-                        continue
-                    
-                    # Create new client
-                    if new_provider == "OpenAI":
-                        client = OpenAI(api_key=api_key)
-                    else:  # OpenRouter
-                        client = OpenAI(
-                            api_key=api_key,
-                            base_url="https://openrouter.ai/api/v1"
-                        )
-                    
-                    # Update variables
-                    provider = new_provider
-                    model = new_model
-                    
-                    # Save configuration
-                    save_config(provider, api_key, model)
-                    console.print(f"[green]✓ Switched to {provider} • {model}[/green]\n")
-                    
-                    # Show updated banner
-                    show_session_banner(provider, model)
-                    
-                    # Reset chat history
-                    chat_history = [system_prompt]
-            
-                elif cmd == "clear":
-                    chat_history = [system_prompt]
-                    console.print("[green]✓ Conversation history cleared[/green]\n")
-                
-                elif cmd == "reset":
-                    console.print("[yellow]🔄 Resetting all configuration...[/yellow]\n")
-                    reset_config()
-                    console.print("[green]✓ Configuration reset[/green]\n")
-                    new_client, new_provider, new_model = choose_provider_and_model(reset=False)
-                    client = new_client
-                    provider = new_provider
-                    model = new_model
-                    
-                    # Show updated banner
-                    show_session_banner(provider, model)
-                    
-                    # Reset chat history
-                    chat_history = [system_prompt]
-                
-                elif cmd == "exit":
-                    console.print("[bold #B8860B]Until the stars speak again.[/bold #B8860B]")
-                    shutdown_mcp_servers()
-                    break
-                else:
+                handler = command_handlers.get(cmd)
+                if handler is None:
                     console.print(f"[yellow]Unknown command: {user_input}[/yellow]")
                     console.print("[dim]Type /help to see available commands[/dim]")
+                elif handler():
+                    break
                 continue
 
-            # Normal AI Chat Message - Process @file mentions FIRST
+            # Normal AI Chat Message
+            _ensure_mcp()
+
+            if system_prompt is None:
+                try:
+                    system_prompt = {
+                        "role": "system",
+                        "content": load_system_prompt_from_md("./prompts/prompt.md")
+                    }
+                except FileNotFoundError as e:
+                    console.print(f"[red]{e}[/red]")
+                    continue
+                except ValueError as e:
+                    console.print(f"[yellow]{e}[/yellow]")
+                    continue
+                chat_history.system_prompt = system_prompt
+
+            # Process @file mentions FIRST
             enhanced_message = process_file_mentions(user_input)
             
             # Check if this is an infrastructure-related query
             is_infra_query = is_infrastructure_related_query(user_input)
 
-            # Add MCP context
-            if mcp_config.get("servers"):
-                try:
-                    mcp_context = get_mcp_context_for_ai(mcp_config)
-                    if mcp_context:
-                        enhanced_message += mcp_context
-                except Exception as e:
-                    console.print(f"[yellow]Error getting MCP context: {e}[/yellow]")
+            # The context sources are independent I/O; gather them on a
+            # small pool and append in the original order, so the wait
+            # is the slowest source instead of the sum of all four.
+            def _mcp_context_task():
+                if not mcp_config.get("servers"):
+                    return ""
+                return get_mcp_context_for_ai(mcp_config)
 
-            # Add GCP context - ONLY for infrastructure queries
-            if is_infra_query:
-                try:
-                    gcp_context = get_gcp_context_for_ai()
-                    if gcp_context:
-                        enhanced_message += gcp_context
-                except Exception as e:
-                    console.print(f"[yellow]Error getting GCP context: {e}[/yellow]")
+            def _gcp_context_task():
+                # GCP context - ONLY for infrastructure queries
+                return get_gcp_context_for_ai() if is_infra_query else ""
 
-            # Add SSH context - ONLY for infrastructure queries
-            if is_infra_query:
-                try:
-                    ssh_context = get_ssh_context_for_ai()
-                    if ssh_context:
-                        enhanced_message += ssh_context
-                except Exception as e:
-                    console.print(f"[yellow]Error getting SSH context: {e}[/yellow]")
+            def _ssh_context_task():
+                # SSH context - ONLY for infrastructure queries
+                return get_ssh_context_for_ai() if is_infra_query else ""
 
-            # Add Infrastructure context - ONLY if query is infrastructure-related
-            if is_infra_query:
-                try:
-                    from .gcp import load_gcp_config
-                    from .infrastructure import has_stored_knowledge
-                    
-                    gcp_config_data = load_gcp_config()
-                    
-                    # Check if we have a GCP project configured
-                    if gcp_config_data.get("project_id"):
-                        # Only load knowledge if it exists
-                        if has_stored_knowledge(gcp_config_data["project_id"]):
-                            console.print("[dim]📚 Loading infrastructure knowledge...[/dim]")
-                            
-                            infra_context = get_infrastructure_context_for_ai(gcp_config_data["project_id"])
-                            if infra_context:
-                                enhanced_message += infra_context
-                                console.print("[dim]✓ Knowledge loaded: VMs, Networks, Firewall Rules, Load Balancers[/dim]\n")
-                except Exception as e:
-                    console.print(f"[yellow]Error getting infrastructure context: {e}[/yellow]")
+            def _infra_context_task():
+                # Infrastructure context - ONLY if query is
+                # infrastructure-related, a project is configured, and
+                # stored knowledge exists
+                if not is_infra_query:
+                    return ""
+                project_id = load_gcp_config().get("project_id")
+                if not project_id or not has_stored_knowledge(project_id):
+                    return ""
+                console.print("[dim]📚 Loading infrastructure knowledge...[/dim]")
+                infra_context = get_infrastructure_context_for_ai(project_id)
+                if infra_context:
+                    console.print("[dim]✓ Knowledge loaded: VMs, Networks, Firewall Rules, Load Balancers[/dim]\n")
+                return infra_context or ""
+
+            context_tasks = (
+                ("MCP", _mcp_context_task),
+                ("GCP", _gcp_context_task),
+                ("SSH", _ssh_context_task),
+                ("infrastructure", _infra_context_task),
+            )
+            with ThreadPoolExecutor(max_workers=len(context_tasks)) as executor:
+                futures = [
+                    (label, executor.submit(task)) for label, task in context_tasks
+                ]
+                for label, future in futures:
+                    try:
+                        context = future.result()
+                        if context:
+                            enhanced_message += context
+                    except Exception as e:
+                        console.print(f"[yellow]Error getting {label} context: {e}[/yellow]")
             
             chat_history.append({"role": "user", "content": enhanced_message})
             
-            spinner = Spinner("circle", text="[dim]Wisdom stirs within me...[/dim]", style="#B8860B")
+            _SPINNER.update(text="[dim]Wisdom stirs within me...[/dim]")
             response_container = {}
 
             def fetch_ai_response():
+                global _TOOLS_CACHE
                 try:
                     # Get MCP manager and available tools
                     manager = get_mcp_manager()
-                    all_tools = manager.get_all_tools()
-                    
-                    # Convert MCP tools to OpenAI tools format
-                    tools = []
-                    if all_tools:
-                        for server_name, server_tools in all_tools.items():
-                            for tool in server_tools:
-                                tools.append({
-                                    "type": "function",
-                                    "function": {
-                                        "name": f"{server_name}_{tool['name']}",
-                                        "description": tool.get('description', ''),
-                                        "parameters": tool.get('inputSchema', {"type": "object", "properties": {}})
-                                    }
-                                })
-                    
-                    # Add GCP/SSH tools ONLY for infrastructure queries
-                    if is_infra_query:
-                        # Add GCP command execution function
-                        from .gcp import load_gcp_config
-                        gcp_config = load_gcp_config()
-                        
-                        if gcp_config.get("project_id"):
+
+                    gcp_config = load_gcp_config() if is_infra_query else {}
+
+                    # The tools list only changes when a server
+                    # connects/disconnects (manager version) or the
+                    # GCP/SSH tool availability flips; reuse the last
+                    # build otherwise instead of re-walking every schema.
+                    gcp_enabled = is_infra_query and bool(gcp_config.get("project_id"))
+                    ssh_enabled = is_infra_query and bool(load_ssh_config().get("default_user"))
+                    signature = (manager.version(), gcp_enabled, ssh_enabled)
+
+                    if _TOOLS_CACHE is not None and _TOOLS_CACHE[0] == signature:
+                        tools = _TOOLS_CACHE[1]
+                    else:
+                        all_tools = manager.get_all_tools()
+
+                        # Convert MCP tools to OpenAI tools format
+                        tools = []
+                        if all_tools:
+                            for server_name, server_tools in all_tools.items():
+                                for tool in server_tools:
+                                    tools.append({
+                                        "type": "function",
+                                        "function": {
+                                            "name": f"{server_name}_{tool['name']}",
+                                            "description": tool.get('description', ''),
+                                            "parameters": tool.get('inputSchema', {"type": "object", "properties": {}})
+                                        }
+                                    })
+
+                        # Add GCP/SSH tools ONLY for infrastructure queries
+                        if gcp_enabled:
                             tools.append({
                                 "type": "function",
                                 "function": {
@@ -673,9 +1100,7 @@ def run_repl(client: OpenAI, provider: str, model: str) -> None:
                             })
 
                         # Add SSH command execution function
-                        ssh_config = load_ssh_config()
-
-                        if ssh_config.get("default_user"):
+                        if ssh_enabled:
                             tools.append({
                                 "type": "function",
                                 "function": {
@@ -697,13 +1122,25 @@ def run_repl(client: OpenAI, provider: str, model: str) -> None:
                                     }
                                 }
                             })
-                    
+
+                        _TOOLS_CACHE = (signature, tools)
+
+                    # Serve a repeat of an identical request (same
+                    # model, history and tools) straight from the
+                    # response cache.
+                    request_messages = chat_history.messages()
+                    cache_key = _response_cache_key(model, request_messages, tools)
+                    cached = _response_cache_get(cache_key)
+                    if cached:
+                        response_container["message"] = cached
+                        return
+
                     # Make initial API call with tools
                     try:
                         if tools:
                             response = client.chat.completions.create(
                                 model=model,
-                                messages=chat_history,
+                                messages=request_messages,
                                 tools=tools,
                                 tool_choice="auto",
                                 timeout=60.0  # Add timeout
@@ -711,7 +1148,7 @@ def run_repl(client: OpenAI, provider: str, model: str) -> None:
                         else:
                             response = client.chat.completions.create(
                                 model=model,
-                                messages=chat_history,
+                                messages=request_messages,
                                 timeout=60.0  # Add timeout
                             )
                     except json.JSONDecodeError as e:
@@ -728,182 +1165,96 @@ def run_repl(client: OpenAI, provider: str, model: str) -> None:
                     max_iterations = 5
                     iteration = 0
                     
-                    while hasattr(message, 'tool_calls') and message.tool_calls and iteration < max_iterations:
-                        iteration += 1
-                        
-                        # Process each tool call
-                        tool_call = message.tool_calls[0]
+                    def _dispatch_tool(tool_call):
+                        """Parse one tool call's arguments and execute
+                        it, returning the raw result dict (or None)."""
                         function_name = tool_call.function.name
-                        
-                        # Parse arguments safely
+
+                        # Parse arguments safely, with the fastest
+                        # installed parser; large gcp arg arrays benefit
+                        # the most.
                         try:
-                            function_args = json.loads(tool_call.function.arguments) if tool_call.function.arguments else {}
-                        except json.JSONDecodeError:
+                            function_args = json_loads(tool_call.function.arguments) if tool_call.function.arguments else {}
+                        except ValueError:
                             console.print(f"[yellow]Warning: Invalid JSON arguments for {function_name}[/yellow]")
                             function_args = {}
-                        
-                        # Execute the tool
-                        tool_result = None
 
-                        if function_name == "gcp_execute_command":
-                            # Execute GCP command directly
-                            from .gcp import run_gcloud_command
-                            from .infrastructure import auto_refresh_knowledge
-                            
-                            args = function_args.get("args", [])
-                            output_format = function_args.get("format", "json")
-                            
-                            # Add format flag if not already present
-                            if output_format and not any("--format" in arg for arg in args):
-                                args.append(f"--format={output_format}")
-                            
-                            console.print(f"\n[dim]⚙️ [#4682B4]gcloud {' '.join(args)}[/#4682B4][/dim]")
-                            
-                            output = run_gcloud_command(args, project_id=gcp_config.get("project_id"))
-                            
-                            if output:
-                                # Truncate very large outputs to prevent JSON parsing issues
-                                max_output_size = 50000  # 50KB limit
-                                if len(output) > max_output_size:
-                                    output = output[:max_output_size] + "\n\n[Output truncated - too large]"
-                                
-                                tool_result = {
-                                    "success": True,
-                                    "output": output,
-                                    "command": f"gcloud {' '.join(args)}"
-                                }
-                                
-                                # Auto-refresh knowledge if this was a modification command
-                                modification_commands = [
-                                    "create", "delete", "update", "add", "remove", 
-                                    "start", "stop", "reset", "set-machine-type",
-                                    "attach-disk", "detach-disk", "add-tags", "remove-tags"
-                                ]
-                                
-                                if any(cmd in args for cmd in modification_commands):
-                                    # Check if knowledge exists before refreshing
-                                    from .infrastructure import has_stored_knowledge
-                                    if has_stored_knowledge(gcp_config.get("project_id")):
-                                        auto_refresh_knowledge(gcp_config.get("project_id"))
-                            else:
-                                tool_result = {
-                                    "success": False,
-                                    "error": "Command failed or returned no output",
-                                    "command": f"gcloud {' '.join(args)}"
-                                }
+                        # One dict lookup for the built-ins, MCP
+                        # fallback for the rest.
+                        handler = _TOOL_HANDLERS.get(function_name)
+                        if handler is not None:
+                            return handler(function_args, gcp_config)
 
-                        elif function_name == "update_infrastructure_knowledge":
-                            # Update infrastructure knowledge
-                            from .infrastructure import update_knowledge_for_ai
-                            
-                            console.print(f"\n[dim]📚 [#4682B4]Updating infrastructure knowledge...[/#4682B4][/dim]")
-                            
-                            result = update_knowledge_for_ai(gcp_config.get("project_id"))
-                            
-                            if result["success"]:
-                                tool_result = result
-                            else:
-                                tool_result = {
-                                    "success": False,
-                                    "error": result.get("error", "Failed to update knowledge")
-                                }
+                        # MCP tool execution
+                        server_name, sep, tool_name = function_name.partition('_')
+                        if sep:
+                            console.print(f"\n[dim]🔧 Using MCP: {server_name}/{tool_name}[/dim]")
 
-                        elif function_name == "ssh_execute_command":
-                            # Execute SSH command
-                            from .ssh import run_ssh_command
-                            
-                            host = function_args.get("host", "")
-                            command = function_args.get("command", "")
-                            
-                            if not host or not command:
-                                tool_result = {
-                                    "success": False,
-                                    "error": "Both 'host' and 'command' are required"
-                                }
-                            else:
-                                console.print(f"\n[dim]🔐 [#4682B4]ssh {host}: {command}[/#4682B4][/dim]")
-                                
-                                result = run_ssh_command(
-                                    host=host,
-                                    command=command,
-                                    timeout=60
-                                )
-                                
-                                if result:
-                                    # Truncate large outputs
-                                    stdout = result["stdout"]
-                                    stderr = result["stderr"]
-                                    max_output_size = 10000  # 10KB limit for SSH
-                                    
-                                    if len(stdout) > max_output_size:
-                                        stdout = stdout[:max_output_size] + "\n[Output truncated]"
-                                    if len(stderr) > max_output_size:
-                                        stderr = stderr[:max_output_size] + "\n[Output truncated]"
-                                    
-                                    tool_result = {
-                                        "success": result["success"],
-                                        "stdout": stdout,
-                                        "stderr": stderr,
-                                        "return_code": result["return_code"],
-                                        "host": host,
-                                        "command": command
-                                    }
-                                else:
-                                    tool_result = {
-                                        "success": False,
-                                        "error": "Failed to execute SSH command",
-                                        "host": host,
-                                        "command": command
-                                    }
-                        
+                            conn = manager.get_connection(server_name)
+                            if conn:
+                                return conn.call_tool(tool_name, function_args)
+                            console.print(f"[yellow]Warning: MCP server '{server_name}' not connected[/yellow]")
+                        return None
+
+                    while hasattr(message, 'tool_calls') and message.tool_calls and iteration < max_iterations:
+                        iteration += 1
+
+                        # Every call in the response is independent
+                        # I/O-bound work, so a multi-call response runs
+                        # on a small pool: wall time is the slowest
+                        # call, not the sum. Rich's console serializes
+                        # concurrent prints internally. Single calls
+                        # skip the pool.
+                        tool_calls = message.tool_calls
+                        if len(tool_calls) == 1:
+                            results = [_dispatch_tool(tool_calls[0])]
                         else:
-                            # MCP tool execution
-                            parts = function_name.split('_', 1)
-                            if len(parts) == 2:
-                                server_name, tool_name = parts
-                                
-                                console.print(f"\n[dim]🔧 Using MCP: {server_name}/{tool_name}[/dim]")
-                                
-                                conn = manager.get_connection(server_name)
-                                if conn:
-                                    tool_result = conn.call_tool(tool_name, function_args)
-                                else:
-                                    console.print(f"[yellow]Warning: MCP server '{server_name}' not connected[/yellow]")
-                        
-                        # Add assistant message with tool calls to history
+                            with ThreadPoolExecutor(max_workers=min(8, len(tool_calls))) as executor:
+                                results = list(executor.map(_dispatch_tool, tool_calls))
+
+                        # Add one assistant message carrying every tool
+                        # call, then the results in matching order.
                         chat_history.append({
                             "role": "assistant",
                             "content": None,
                             "tool_calls": [{
-                                "id": tool_call.id,
+                                "id": tc.id,
                                 "type": "function",
                                 "function": {
-                                    "name": function_name,
-                                    "arguments": tool_call.function.arguments or "{}"
+                                    "name": tc.function.name,
+                                    "arguments": tc.function.arguments or "{}"
                                 }
-                            }]
-                        })
-                        
-                        # Add tool result to history (truncate if needed)
-                        tool_result_str = json.dumps(tool_result) if tool_result else "{}"
-                        max_tool_result_size = 30000  # 30KB limit
-                        if len(tool_result_str) > max_tool_result_size:
-                            # Try to truncate the output field if it exists
-                            if tool_result and "output" in tool_result:
-                                tool_result["output"] = tool_result["output"][:10000] + "\n[Truncated for context size]"
-                                tool_result_str = json.dumps(tool_result)
-                        
-                        chat_history.append({
-                            "role": "tool",
-                            "tool_call_id": tool_call.id,
-                            "content": tool_result_str
+                            } for tc in tool_calls]
                         })
+
+                        for tool_call, tool_result in zip(tool_calls, results):
+                            # The output field dominates oversize
+                            # results, so cap it before serializing
+                            # instead of dumping, measuring and dumping
+                            # again.
+                            if tool_result:
+                                output = tool_result.get("output")
+                                if isinstance(output, str) and len(output) > 10000:
+                                    tool_result["output"] = output[:10000] + "\n[Truncated for context size]"
+                                # One dump, one UTF-8 pass: json_dumps
+                                # decodes orjson's bytes exactly once,
+                                # and message content must be str for
+                                # the SDK.
+                                tool_result_str = json_dumps(tool_result)
+                            else:
+                                tool_result_str = "{}"
+
+                            chat_history.append({
+                                "role": "tool",
+                                "tool_call_id": tool_call.id,
+                                "content": tool_result_str
+                            })
                         
                         # Get next response with error handling
                         try:
                             response = client.chat.completions.create(
                                 model=model,
-                                messages=chat_history,
+                                messages=chat_history.messages(),
                                 tools=tools,
                                 tool_choice="auto",
                                 timeout=60.0
@@ -917,20 +1268,27 @@ def run_repl(client: OpenAI, provider: str, model: str) -> None:
                             return
                     
                     # Final response
-                    response_container["message"] = message.content.strip() if message.content else ""
+                    final = message.content.strip() if message.content else ""
+                    response_container["message"] = final
+                    if final:
+                        _response_cache_put(cache_key, final)
                         
                 except json.JSONDecodeError as e:
                     response_container["error"] = f"JSON parsing error: {str(e)}\n\nThis usually happens when:\n1. The API response is too large\n2. Network connection was interrupted\n3. The context is too long\n\nTry:\n- Asking a simpler question\n- Using /clear to reset conversation\n- Checking your internet connection"
                 except Exception as e:
                     response_container["error"] = str(e)
-                    import traceback
                     console.print(f"[red]Error in fetch_ai_response:[/red]")
                     traceback.print_exc()
 
+            # Worker thread + Live spinner rather than an asyncio loop:
+            # everything this worker touches (cached sync OpenAI
+            # clients, subprocess-based tools, the prompt_toolkit
+            # session driving this loop) is synchronous, and join() in
+            # the main thread stays interruptible by Ctrl+C.
             thread = Thread(target=fetch_ai_response, daemon=True)
             thread.start()
 
-            with Live(spinner, refresh_per_second=12, transient=True):
+            with Live(_SPINNER, refresh_per_second=12, transient=True):
                 thread.join()
 
             if "error" in response_container:
@@ -942,19 +1300,18 @@ def run_repl(client: OpenAI, provider: str, model: str) -> None:
             
             # Add final AI response to history
             if ai_message:
-                if not (chat_history and 
-                        chat_history[-1].get("role") == "assistant" and 
-                        chat_history[-1].get("content") == ai_message):
+                # Length check first: it short-circuits the multi-KB
+                # string comparison in O(1) for the common non-dup case.
+                last = chat_history.last()
+                if not (last and
+                        last.get("role") == "assistant" and
+                        len(last.get("content") or "") == len(ai_message) and
+                        last["content"] == ai_message):
                     chat_history.append({"role": "assistant", "content": ai_message})
             
             # Display AI response
             if ai_message:
-                console.print(Panel(
-                    ai_message, 
-                    title="[bold #B8860B]Thoth[/bold #B8860B]",
-                    border_style="#B8860B",
-                    padding=(1, 2)
-                ))
+                console.print(Panel(ai_message, **_AI_PANEL_KW))
 
         except KeyboardInterrupt:
             console.print("\n[dim]Press Ctrl+C again or type /exit to quit[/dim]")
@@ -969,7 +1326,6 @@ def run_repl(client: OpenAI, provider: str, model: str) -> None:
                 border_style="red",
                 padding=(1, 2)
             ))
-            import traceback
             traceback.print_exc()
     
     # Ensure cleanup
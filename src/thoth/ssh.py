@@ -1,7 +1,13 @@
 
 
+import base64
+import copy
 import json
+import os
+import select
 import subprocess
+import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 from rich.panel import Panel
@@ -9,23 +15,103 @@ from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from .display import console, select_with_arrows
 from .crypto import encrypt_value, decrypt_value
+from .gcp import json_loads
 
 SSH_CONFIG_PATH = Path.home() / ".thoth_ssh_config.json"
 
+# Multiplexed-connection sockets: the first command to a host pays the
+# TCP + key-exchange cost, later ones ride the existing connection for
+# as long as ControlPersist keeps it open.
+_SSH_CONTROL_DIR = Path.home() / ".thoth_ssh_cm"
+_control_dir_ready = False
+
+# Stored passwords are packed as base64(magic + ciphertext); the
+# 4-byte magic check is a single compare instead of a string prefix
+# scan, and versions the format for future encryption changes. Plain
+# "encrypted:"-prefixed values from older configs still load.
+_PW_MAGIC = b"TH01"
+
+# Column layout for show_ssh_config, defined once instead of per call.
+_SSH_TABLE_COLUMNS = (
+    ("Setting", {"style": "cyan", "no_wrap": True}),
+    ("Value", {"style": "white"}),
+)
+
+# Invariant parts of every ssh invocation, built once instead of
+# re-extended list-by-list per call.
+_SSH_BASE_OPTS = (
+    "-o", "StrictHostKeyChecking=no",
+    "-o", "UserKnownHostsFile=/dev/null",
+    "-o", "LogLevel=ERROR",
+    "-o", "ConnectTimeout=10",
+)
+_SSH_CONTROL_OPTS = (
+    "-o", "ControlMaster=auto",
+    "-o", f"ControlPath={_SSH_CONTROL_DIR}/%r@%h:%p",
+    "-o", "ControlPersist=60s",
+)
+
+
+@lru_cache(maxsize=4)
+def _port_opts(port: int) -> tuple:
+
+    return ("-p", str(port)) if port != 22 else ()
+
+
+# Per-stream capture cap. Callers truncate to 10KB anyway, so anything
+# beyond this is read and dropped (or the process stopped) rather than
+# accumulated in memory.
+_MAX_CAPTURE = 10_000
+
+
+def _ensure_control_dir() -> bool:
+
+    global _control_dir_ready
+    if not _control_dir_ready:
+        try:
+            _SSH_CONTROL_DIR.mkdir(mode=0o700, exist_ok=True)
+            _control_dir_ready = True
+        except OSError:
+            return False
+    return True
+
+# Parsed-and-decrypted config keyed by (mtime_ns, size), same scheme as
+# load_mcp_config: repeat loads within a chat turn cost one stat instead
+# of a read + parse + decrypt. Callers get a copy to mutate freely.
+_CONFIG_CACHE: Optional[tuple] = None
+
 
 def load_ssh_config() -> Dict[str, Any]:
-    
-    if not SSH_CONFIG_PATH.exists():
+
+    global _CONFIG_CACHE
+
+    try:
+        st = SSH_CONFIG_PATH.stat()
+    except FileNotFoundError:
         return {}
-    
+
+    stat_key = (st.st_mtime_ns, st.st_size)
+    if _CONFIG_CACHE is not None and _CONFIG_CACHE[0] == stat_key:
+        return copy.deepcopy(_CONFIG_CACHE[1])
+
     try:
-        data = json.loads(SSH_CONFIG_PATH.read_text(encoding="utf-8"))
-        
-        if data.get("password") and data["password"].startswith("encrypted:"):
+        data = json_loads(SSH_CONFIG_PATH.read_bytes())
+
+        stored = data.pop("password_b64", None)
+        if stored:
+            try:
+                raw = base64.b64decode(stored)
+                if raw[:4] == _PW_MAGIC:
+                    data["password"] = decrypt_value(raw[4:].decode())
+            except (ValueError, UnicodeDecodeError):
+                pass
+        elif data.get("password") and data["password"].startswith("encrypted:"):
+            # Legacy format from configs written before the packed form.
             data["password"] = decrypt_value(data["password"][10:])
         if data.get("private_key_path"):
-            
+
             data["private_key_path"] = str(Path(data["private_key_path"]).expanduser())
+        _CONFIG_CACHE = (stat_key, copy.deepcopy(data))
         return data
     except Exception as e:
         console.print(f"[red]Error loading SSH config: {e}[/red]")
@@ -33,16 +119,28 @@ def load_ssh_config() -> Dict[str, Any]:
 
 
 def save_ssh_config(config: Dict[str, Any]) -> None:
-    
+
     config_copy = config.copy()
-    
-    
+
+
     if config_copy.get("password"):
-        config_copy["password"] = f"encrypted:{encrypt_value(config_copy['password'])}"
-    
+        token = encrypt_value(config_copy.pop("password"))
+        config_copy["password_b64"] = base64.b64encode(_PW_MAGIC + token.encode()).decode()
+
     SSH_CONFIG_PATH.write_text(json.dumps(config_copy, indent=2), encoding="utf-8")
     SSH_CONFIG_PATH.chmod(0o600)
 
+    global _CONFIG_CACHE
+    _CONFIG_CACHE = None
+
+
+@lru_cache(maxsize=4)
+def _resolve_key(path: str) -> Optional[str]:
+    """Expand and existence-check a private-key path once per session;
+    the key file does not move while the REPL runs."""
+    resolved = Path(path).expanduser()
+    return str(resolved) if resolved.exists() else None
+
 
 def run_ssh_command(
     host: str,
@@ -88,48 +186,77 @@ def run_ssh_command(
         }
     
     try:
-        
-        ssh_cmd = ["ssh"]
-        
-        
-        if port != 22:
-            ssh_cmd.extend(["-p", str(port)])
-        
-        
-        if private_key_path and Path(private_key_path).exists():
-            ssh_cmd.extend(["-i", private_key_path])
-        
-        
-        ssh_cmd.extend([
-            "-o", "StrictHostKeyChecking=no",
-            "-o", "UserKnownHostsFile=/dev/null",
-            "-o", "LogLevel=ERROR",
-            "-o", "ConnectTimeout=10"
-        ])
-        
-        
-        ssh_cmd.append(f"{user}@{host}")
-        
-        
-        ssh_cmd.append(command)
-        
-        
+        key_path = _resolve_key(private_key_path) if private_key_path else None
+        key_opts = ("-i", key_path) if key_path else ()
+
+        # Reuse one connection per (user, host, port); repeat commands
+        # skip the handshake entirely. sshpass is only actually needed
+        # for the call that opens the master connection.
+        control_opts = _SSH_CONTROL_OPTS if _ensure_control_dir() else ()
+
+        # One list built from cached tuples, instead of a dozen
+        # append/extend calls per invocation.
+        ssh_cmd = [
+            "ssh", *_port_opts(port), *key_opts, *_SSH_BASE_OPTS,
+            *control_opts, f"{user}@{host}", command
+        ]
+
         if password:
-            
-            ssh_cmd = ["sshpass", "-p", password] + ssh_cmd
-        
-        result = subprocess.run(
+            ssh_cmd = ["sshpass", "-p", password, *ssh_cmd]
+
+
+        # Incremental capped reads instead of capture_output=True:
+        # memory stays O(cap) however much the remote command emits,
+        # and a command still spewing after both caps are hit is
+        # terminated early instead of being drained to completion.
+        proc = subprocess.Popen(
             ssh_cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
         )
-        
+
+        out_buf = bytearray()
+        err_buf = bytearray()
+        bufs = {proc.stdout.fileno(): out_buf, proc.stderr.fileno(): err_buf}
+        open_fds = set(bufs)
+        deadline = time.monotonic() + timeout
+        capped = False
+
+        while open_fds:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                proc.kill()
+                proc.wait()
+                raise subprocess.TimeoutExpired(ssh_cmd, timeout)
+            readable, _, _ = select.select(list(open_fds), [], [], remaining)
+            for fd in readable:
+                chunk = os.read(fd, 8192)
+                if not chunk:
+                    open_fds.discard(fd)
+                elif len(bufs[fd]) <= _MAX_CAPTURE:
+                    # Slightly over-fill so callers can detect the
+                    # truncation; excess past that is discarded.
+                    bufs[fd].extend(chunk)
+            if len(out_buf) > _MAX_CAPTURE and len(err_buf) > _MAX_CAPTURE:
+                capped = True
+                proc.terminate()
+                break
+
+        if capped:
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        else:
+            proc.wait()
+
         return {
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "return_code": result.returncode,
-            "success": result.returncode == 0
+            "stdout": bytes(out_buf).decode("utf-8", errors="replace"),
+            "stderr": bytes(err_buf).decode("utf-8", errors="replace"),
+            "return_code": proc.returncode,
+            "success": proc.returncode == 0
         }
     
     except subprocess.TimeoutExpired:
@@ -284,8 +411,8 @@ def show_ssh_config() -> None:
         return
     
     table = Table(title="SSH Configuration", border_style="cyan")
-    table.add_column("Setting", style="cyan", no_wrap=True)
-    table.add_column("Value", style="white")
+    for header, column_kw in _SSH_TABLE_COLUMNS:
+        table.add_column(header, **column_kw)
     
     table.add_row("Default User", config.get("default_user", "[dim]Not set[/dim]"))
     
@@ -359,41 +486,39 @@ def test_ssh_connection() -> None:
     console.print("\n[dim]Fetching running VMs...[/dim]\n")
     
     
+    # Server-side projection: gcloud returns one tab-separated line per
+    # VM with exactly the three fields used below, so there is no JSON
+    # document to transfer or parse at all.
     output = run_gcloud_command(
-        ["compute", "instances", "list", "--filter=status=RUNNING", "--format=json"],
+        [
+            "compute", "instances", "list", "--filter=status=RUNNING",
+            "--format=value(name,zone.basename(),networkInterfaces[0].networkIP)"
+        ],
         project_id=gcp_config.get("project_id")
     )
-    
+
     if not output:
         console.print("[yellow]No running VMs found[/yellow]\n")
         return
-    
+
     try:
-        vms = json.loads(output)
-        
-        if not vms:
-            console.print("[yellow]No running VMs found[/yellow]\n")
-            return
-        
-        
         vm_options = {}
-        for vm in vms:
-            vm_name = vm.get("name", "")
-            zone = vm.get("zone", "").split("/")[-1]
-            
-            
-            internal_ip = ""
-            for interface in vm.get("networkInterfaces", []):
-                if interface.get("networkIP"):
-                    internal_ip = interface["networkIP"]
-                    break
-            
+        for line in output.splitlines():
+            parts = line.split("\t")
+            if len(parts) != 3:
+                continue
+            vm_name, zone, internal_ip = parts
+
             vm_options[f"{vm_name} ({zone}) - {internal_ip}"] = {
                 "name": vm_name,
                 "zone": zone,
                 "ip": internal_ip
             }
-        
+
+        if not vm_options:
+            console.print("[yellow]No running VMs found[/yellow]\n")
+            return
+
         selected = select_with_arrows(
             {k: k for k in vm_options.keys()},
             prompt_text="Select VM to test SSH connection"
@@ -438,7 +563,5 @@ def test_ssh_connection() -> None:
         
         console.print()
         
-    except json.JSONDecodeError:
-        console.print("[red]Error parsing VM list[/red]\n")
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]\n")
\ No newline at end of file
@@ -1,17 +1,55 @@
 
 
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Union
+
+
+@lru_cache(maxsize=16)
+def _read_prompt(path: str, mtime_ns: int) -> str:
+    # mtime_ns keys the cache entry; an edited file gets a fresh read.
+    content = Path(path).read_text(encoding="utf-8").strip()
+    if not content:
+        raise ValueError(f"Prompt file '{path}' is empty.")
+    return content
 
 
 def load_system_prompt_from_md(file_path: str = "./prompts/prompt.md") -> str:
-    
+
     path = Path(file_path)
-    
-    if not path.exists() or not path.is_file():
+
+    if not path.is_file():
         raise FileNotFoundError(f"Prompt file not found: {file_path}")
-    
-    content = path.read_text(encoding="utf-8").strip()
-    if not content:
-        raise ValueError(f"Prompt file '{file_path}' is empty.")
-    
-    return content
\ No newline at end of file
+
+    return _read_prompt(file_path, path.stat().st_mtime_ns)
+
+
+def write_private_file(path: Path, content: Union[str, bytes]) -> None:
+
+    # Create with mode 0o600 in a single open so the file is never
+    # momentarily visible with umask-default permissions.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        os.write(fd, content)
+    finally:
+        os.close(fd)
+
+
+def replace_private_file(path: Path, content: Union[str, bytes]) -> None:
+
+    # Atomic variant: the bytes land in a same-directory temp file
+    # (0o600 from creation) that is fsynced and renamed over the
+    # target, so readers never see a partial or default-perm file.
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, content)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
@@ -0,0 +1,31 @@
+import re
+
+import pytest
+
+from thoth import repl
+
+
+MESSAGE = "check @demo.txt and @a/b.py, then @demo.txt again"
+EXPECTED = ["demo.txt", "a/b.py"]
+
+
+def test_extract_mentions_with_re(monkeypatch):
+    monkeypatch.setattr(repl, "_FILE_MENTION_RE", re.compile(repl._MENTION_PATTERN))
+    assert repl._extract_mentions(MESSAGE) == EXPECTED
+
+
+def test_extract_mentions_with_reru_findall_semantics(monkeypatch):
+    # reru.findall returns the whole match ('@demo.txt'), not group 1;
+    # mimic that so the '@'-stripping is covered without reru installed.
+    class FullMatchEngine:
+        def findall(self, message):
+            return [m.group(0) for m in re.finditer(repl._MENTION_PATTERN, message)]
+
+    monkeypatch.setattr(repl, "_FILE_MENTION_RE", FullMatchEngine())
+    assert repl._extract_mentions(MESSAGE) == EXPECTED
+
+
+@pytest.mark.skipif(repl.reru is None, reason="reru not installed")
+def test_extract_mentions_with_reru(monkeypatch):
+    monkeypatch.setattr(repl, "_FILE_MENTION_RE", repl.reru.compile(repl._MENTION_PATTERN))
+    assert repl._extract_mentions(MESSAGE) == EXPECTED